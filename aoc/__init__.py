@@ -0,0 +1 @@
+# Shared tooling for running the dayNN solvers from a single process.
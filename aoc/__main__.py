@@ -0,0 +1,130 @@
+import argparse
+import logging
+import os
+import sys
+import time
+from itertools import groupby
+
+from aoc.cache import DEFAULTCACHEDIR, DEFAULTCACHESIZE, ResultCache, fileHash
+from aoc.days import DAYS, PARTS, loadDays, setLogLevel
+from aoc.profiling import DEFAULTPROFILEDIR, DEFAULTTOP, allocationTracer, profiler
+from aoc.runner import runDay, runParallel, formatTable, toJson
+
+logger = logging.getLogger(__name__)
+
+
+def parseArgs(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m aoc", description="Run the dayNN solvers in a single process.")
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default: all)")
+    parser.add_argument("-i", "--input", default=None,
+                        help="input path template, e.g. 'inputs/day{day:02d}.txt' (default: dayNN/input.txt)")
+    parser.add_argument("--json", metavar="FILE", help="also write the results as JSON ('-' for stdout)")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="number of worker processes, 0 for one per CPU (default: 1, run in-process)")
+    parser.add_argument("--stream", action="store_true",
+                        help="feed the parts which support it a lazy line iterator instead of a list, "
+                             "so huge inputs are processed in constant memory (-i - reads stdin)")
+    parser.add_argument("--no-cache", action="store_true", help="neither read nor write the result cache")
+    parser.add_argument("--cache-dir", default=DEFAULTCACHEDIR, help=f"result cache location (default: {DEFAULTCACHEDIR})")
+    parser.add_argument("--cache-size", type=int, default=DEFAULTCACHESIZE,
+                        help=f"maximum size of the result cache in bytes (default: {DEFAULTCACHESIZE})")
+    parser.add_argument("--profile", nargs="?", const=DEFAULTPROFILEDIR, metavar="DIR",
+                        help=f"run each part under cProfile, dump dayNN_partP.pstats into DIR (default: {DEFAULTPROFILEDIR}) "
+                             "and print the hottest functions")
+    parser.add_argument("--alloc", action="store_true",
+                        help="measure the memory allocated by each part with tracemalloc (slows the parts down)")
+    parser.add_argument("--trace-alloc", action="store_true",
+                        help="trace each part with tracemalloc and print its peak and top allocation sites")
+    parser.add_argument("--top", type=int, default=DEFAULTTOP,
+                        help=f"number of functions/allocation sites to print (default: {DEFAULTTOP})")
+    parser.add_argument("-v", "--verbose", action="store_true", help="show the log output of the solvers")
+    parser.add_argument("--debug", type=lambda value: [int(day) for day in value.split(",")], default=[], metavar="DAYS",
+                        help="comma separated days whose debug traces are shown, e.g. '3,20'")
+    args = parser.parse_args(argv)
+    for day in args.days + args.debug:
+        if day not in DAYS:
+            parser.error(f"No such day: {day}")
+    if args.jobs < 0:
+        parser.error("--jobs must not be negative")
+    if args.input == "-":
+        # stdin can only be consumed by one day, in this process
+        if len(args.days) != 1:
+            parser.error("reading the input from stdin needs exactly one day")
+        if args.jobs != 1:
+            parser.error("reading the input from stdin needs --jobs 1")
+        args.no_cache = True
+    if args.profile and args.trace_alloc:
+        # both hook into sys.setprofile and would measure each other
+        parser.error("--profile and --trace-alloc are mutually exclusive")
+    if args.alloc:
+        # the cached results were measured without tracing
+        args.no_cache = True
+    if args.profile or args.trace_alloc:
+        # cached parts would not be measured, and the reports are printed by the process running the part
+        if args.jobs != 1:
+            parser.error("--profile and --trace-alloc need --jobs 1")
+        args.no_cache = True
+    return args
+
+
+def main(argv=None):
+    args = parseArgs(argv)
+    # configure logging before the solvers do it on import, so they stay quiet by default
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+    for day in args.debug:
+        setLogLevel(day, logging.DEBUG)
+
+    def inputFile(day):
+        return args.input.format(day=day.number) if args.input else day.defaultInput()
+
+    start = time.perf_counter()
+    days = {day.number: day for day in loadDays(args.days)}
+    cache = None if args.no_cache else ResultCache(args.cache_dir, args.cache_size)
+
+    # answer whatever we can from the cache, everything else is a job
+    results = []
+    jobs = []
+    inputhashes = {}
+    for day in days.values():
+        infile = inputFile(day)
+        if cache is not None and os.path.isfile(infile):
+            inputhashes[day.number] = fileHash(infile)
+        for part in PARTS:
+            cached = cache.get(day, part, inputhashes[day.number]) if day.number in inputhashes else None
+            if cached is not None:
+                results.append(cached)
+            else:
+                jobs.append((day.number, part, infile))
+
+    hooks = []
+    if args.trace_alloc:
+        hooks.append(allocationTracer(args.top))
+    if args.profile:
+        hooks.append(profiler(args.profile, args.top))
+
+    if args.jobs == 1:
+        computed = []
+        for (daynumber, infile), dayjobs in groupby(jobs, key=lambda job: (job[0], job[2])):
+            computed.extend(runDay(days[daynumber], infile, parts=[part for (_, part, _) in dayjobs], hooks=hooks,
+                                   stream=args.stream, tracealloc=args.alloc))
+    else:
+        computed = runParallel(jobs, args.jobs or os.cpu_count(), stream=args.stream, tracealloc=args.alloc)
+    for result in computed:
+        if result.day in inputhashes:
+            cache.put(days[result.day], result.part, inputhashes[result.day], result)
+    results = sorted(results + computed, key=lambda r: (r.day, r.part))
+    elapsed = time.perf_counter() - start
+
+    if args.json == "-":
+        print(toJson(results))
+    else:
+        print(formatTable(results, elapsed))
+        if args.json:
+            with open(args.json, "w") as f:
+                f.write(toJson(results))
+    return 1 if any(r.status == "error" for r in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,120 @@
+import argparse
+import glob
+import json
+import logging
+import os
+import re
+import sys
+
+from aoc.days import DAYS, Day
+from aoc.runner import jsonable, runDay
+
+logger = logging.getLogger(__name__)
+
+DAYREGEX = re.compile(r"day[_-]?0*(\d{1,2})(?!\d)", re.IGNORECASE)
+
+
+def inferDay(path: str) -> int:
+    # the last dayNN in the path wins, so corpus/day05/account3.txt and inputs/day05.txt both work
+    matches = DAYREGEX.findall(path)
+    if not matches or int(matches[-1]) not in DAYS:
+        return None
+    return int(matches[-1])
+
+
+def collectInputs(patterns, day: int = None) -> list[tuple[int, str]]:
+    # directories are searched recursively, everything else is treated as a glob
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            found = (os.path.join(directory, f) for directory, _, files in os.walk(pattern) for f in files)
+            paths.extend(sorted(path for path in found if path.endswith(".txt")))
+        else:
+            matches = sorted(glob.glob(pattern, recursive=True))
+            if not matches:
+                logger.warning(f"No input matches {pattern}")
+            paths.extend(path for path in matches if os.path.isfile(path))
+    inputs = []
+    for path in dict.fromkeys(paths):
+        daynumber = day if day is not None else inferDay(path)
+        if daynumber is None:
+            logger.warning(f"Cannot tell the day of {path}, use --day")
+            continue
+        inputs.append((daynumber, path))
+    return inputs
+
+
+# per worker process, the modules stay loaded together with their compiled regexes and tables
+_days = {}
+
+
+def solveInput(daynumber: int, infile: str):
+    if daynumber not in _days:
+        _days[daynumber] = Day(daynumber)
+    return daynumber, infile, runDay(_days[daynumber], infile)
+
+
+def formatLine(daynumber: int, infile: str, results) -> str:
+    columns = [infile, f"{daynumber:02d}"]
+    for r in results:
+        columns.append(str(r.result) if r.status == "ok" else r.status)
+    return "\t".join(columns)
+
+
+def jsonLine(daynumber: int, infile: str, results) -> str:
+    return json.dumps({"input": infile, "day": daynumber,
+                       "results": {str(r.part): jsonable(r.result) for r in results if r.status == "ok"},
+                       "status": {str(r.part): r.status for r in results},
+                       "wall": sum(r.wall for r in results)})
+
+
+def parseArgs(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m aoc.batch",
+                                     description="Solve many inputs in one invocation, one result line per input.")
+    parser.add_argument("inputs", nargs="+", help="input files, directories or globs (quote them), "
+                                                  "e.g. 'corpus/**/day05*.txt'")
+    parser.add_argument("-d", "--day", type=int, help="day of all inputs (default: from dayNN in the path)")
+    parser.add_argument("-j", "--jobs", type=int, default=0,
+                        help="number of worker processes, 0 for one per CPU, 1 to run in-process (default: 0)")
+    parser.add_argument("--json", action="store_true", help="write JSON lines instead of tab separated columns")
+    parser.add_argument("-v", "--verbose", action="store_true", help="show the log output of the solvers")
+    args = parser.parse_args(argv)
+    if args.day is not None and args.day not in DAYS:
+        parser.error(f"No such day: {args.day}")
+    if args.jobs < 0:
+        parser.error("--jobs must not be negative")
+    return args
+
+
+def main(argv=None):
+    args = parseArgs(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+    inputs = collectInputs(args.inputs, args.day)
+    if not inputs:
+        logger.error("No inputs found")
+        return 2
+    output = jsonLine if args.json else formatLine
+
+    numworkers = min(args.jobs or os.cpu_count(), len(inputs))
+    failed = False
+    if numworkers == 1:
+        solved = (solveInput(*job) for job in inputs)
+        executor = None
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=numworkers)
+        # map keeps the input order, the lines are still written as soon as they are due
+        solved = executor.map(solveInput, *zip(*inputs), chunksize=max(1, len(inputs) // (numworkers * 8)))
+    try:
+        for daynumber, infile, results in solved:
+            print(output(daynumber, infile, results), flush=True)
+            failed = failed or any(r.status == "error" for r in results)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
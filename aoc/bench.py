@@ -0,0 +1,253 @@
+import argparse
+import json
+import logging
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+from aoc.cache import fileHash
+from aoc.days import DAYS, PARTS, ROOT, loadDays
+from aoc.runner import formatSize, readInput, runPart
+
+logger = logging.getLogger(__name__)
+
+BASELINEVERSION = 1
+DEFAULTBASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+SYNTHETICDIR = os.path.join(ROOT, "synthetic")
+
+
+class BenchResult:
+    def __init__(self, suite: str, day: int, part: int, status: str, times=(), peakmem: int = None,
+                 inputhash: str = None, error: str = None):
+        self.suite = suite
+        self.day = day
+        self.part = part
+        self.status = status
+        self.times = list(times)
+        self.peakmem = peakmem
+        self.inputhash = inputhash
+        self.error = error
+
+    @property
+    def key(self) -> str:
+        return f"{self.suite}/{self.day:02d}/{self.part}"
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times) if self.times else None
+
+    @property
+    def p95(self) -> float:
+        return percentile(self.times, 95) if self.times else None
+
+    def asdict(self):
+        return {
+            "suite": self.suite,
+            "day": self.day,
+            "part": self.part,
+            "status": self.status,
+            "runs": len(self.times),
+            "median": self.median,
+            "p95": self.p95,
+            "peakmem": self.peakmem,
+            "inputhash": self.inputhash,
+            "error": self.error,
+        }
+
+    def __str__(self):
+        return f"{self.key}: {self.status} median {self.median} p95 {self.p95} peak {self.peakmem}"
+
+    def __repr__(self):
+        return self.__str__()
+
+
+def percentile(values, pct: float) -> float:
+    # nearest rank, so the p95 of a handful of runs is an actually observed time
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def benchPart(suite: str, day, part: int, infile: str, repeat: int) -> BenchResult:
+    inputhash = fileHash(infile)
+    lines = readInput(infile)
+    times = []
+    for _ in range(repeat):
+        result = runPart(day, part, lines)
+        if result.status != "ok":
+            return BenchResult(suite, day.number, part, result.status, inputhash=inputhash, error=result.error)
+        times.append(result.wall)
+    # separate run for the memory, tracemalloc slows the solvers down considerably
+    tracemalloc.start()
+    try:
+        runPart(day, part, lines)
+        _, peakmem = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return BenchResult(suite, day.number, part, "ok", times=times, peakmem=peakmem, inputhash=inputhash)
+
+
+def syntheticInputs(days, scale: float, seed: int) -> dict:
+    # generated once and kept, the generators are deterministic for a given scale and seed
+    from aoc.generate import generate
+    directory = os.path.join(SYNTHETICDIR, f"bench-s{scale:g}-seed{seed}")
+    os.makedirs(directory, exist_ok=True)
+    paths = {}
+    for day in days:
+        path = os.path.join(directory, f"day{day.number:02d}.txt")
+        if not os.path.isfile(path):
+            logger.info(f"Generating {path}")
+            with open(path + ".tmp", "w") as f:
+                f.write(generate(day.number, scale, seed))
+            os.replace(path + ".tmp", path)
+        paths[day.number] = path
+    return paths
+
+
+def runSuite(suite: str, days, inputs: dict, repeat: int) -> list[BenchResult]:
+    results = []
+    for day in days:
+        infile = inputs.get(day.number)
+        for part in PARTS:
+            if part not in day.parts:
+                continue
+            if infile is None or not os.path.isfile(infile):
+                results.append(BenchResult(suite, day.number, part, "noinput", error=f"{infile} not found"))
+                continue
+            logger.info(f"Benchmarking {suite} day {day.number:02d} part {part}")
+            results.append(benchPart(suite, day, part, infile, repeat))
+    return results
+
+
+def loadBaseline(path: str) -> dict:
+    if not os.path.isfile(path):
+        return None
+    with open(path) as f:
+        baseline = json.load(f)
+    if baseline.get("version") != BASELINEVERSION:
+        raise ValueError(f"Baseline {path} has version {baseline.get('version')}, expected {BASELINEVERSION}")
+    return baseline
+
+
+def saveBaseline(path: str, results: list[BenchResult], repeat: int, previous: dict = None):
+    # entries of days/suites which were not run this time are kept
+    benchmarks = dict(previous["benchmarks"]) if previous else {}
+    benchmarks.update({r.key: r.asdict() for r in results if r.status == "ok"})
+    baseline = {
+        "version": BASELINEVERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()} ({os.cpu_count()} CPUs)",
+        "repeat": repeat,
+        "benchmarks": dict(sorted(benchmarks.items())),
+    }
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path + ".tmp", "w") as f:
+        json.dump(baseline, f, indent=2)
+        f.write("\n")
+    os.replace(path + ".tmp", path)
+
+
+def compare(result: BenchResult, reference: dict, threshold: float, mindelta: float) -> str:
+    # returns a short verdict, anything starting with "REGRESSION" fails the run
+    if reference is None:
+        return "new"
+    if reference.get("inputhash") != result.inputhash:
+        return "input changed"
+    if result.status != "ok":
+        return f"REGRESSION ({result.status})"
+    verdicts = []
+    change = result.median / reference["median"] - 1 if reference["median"] else 0.0
+    if change > threshold and result.median - reference["median"] > mindelta:
+        verdicts.append(f"REGRESSION time {change:+.0%}")
+    if reference.get("peakmem") and result.peakmem > reference["peakmem"] * (1 + threshold) + 64 * 1024:
+        verdicts.append(f"REGRESSION memory {result.peakmem / reference['peakmem'] - 1:+.0%}")
+    return ", ".join(verdicts) or f"{change:+.0%}"
+
+
+def formatBench(results: list[BenchResult], verdicts: dict) -> str:
+    header = ("Suite", "Day", "Part", "Status", "Median [s]", "p95 [s]", "Peak mem", "Baseline")
+    rows = [(r.suite, f"{r.day:02d}", str(r.part), r.status,
+             f"{r.median:.4f}" if r.times else "", f"{r.p95:.4f}" if r.times else "", formatSize(r.peakmem),
+             verdicts.get(r.key, "") if r.status == "ok" or r.key in verdicts else (r.error or "")) for r in results]
+    widths = [max(len(row[i]) for row in [header] + rows) for i in range(len(header))]
+    lines = ["  ".join(val.ljust(width) for val, width in zip(row, widths)).rstrip() for row in [header] + rows]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+
+def parseArgs(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m aoc.bench",
+                                     description="Benchmark the solvers against a stored baseline.")
+    parser.add_argument("days", nargs="*", type=int, help="days to benchmark (default: all)")
+    parser.add_argument("-i", "--input", default=None,
+                        help="real input path template, e.g. 'inputs/day{day:02d}.txt' (default: dayNN/input.txt)")
+    parser.add_argument("--no-real", action="store_true", help="skip the real inputs")
+    parser.add_argument("-s", "--scale", type=float, action="append",
+                        help="scale of a synthetic suite, may be repeated (default: 1)")
+    parser.add_argument("--no-synthetic", action="store_true", help="skip the synthetic inputs")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the synthetic inputs (default: 0)")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="timed runs per part (default: 5)")
+    parser.add_argument("-b", "--baseline", default=DEFAULTBASELINE, help=f"baseline file (default: {DEFAULTBASELINE})")
+    parser.add_argument("--save", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("-t", "--threshold", type=float, default=0.2,
+                        help="relative slowdown or memory growth that counts as a regression (default: 0.2)")
+    parser.add_argument("--min-delta", type=float, default=0.005,
+                        help="ignore slowdowns below this many seconds, they are mostly noise (default: 0.005)")
+    parser.add_argument("--json", metavar="FILE", help="also write the results as JSON ('-' for stdout)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="show progress and the log output of the solvers")
+    args = parser.parse_args(argv)
+    for day in args.days:
+        if day not in DAYS:
+            parser.error(f"No such day: {day}")
+    if args.repeat < 1:
+        parser.error("--repeat must be positive")
+    return args
+
+
+def main(argv=None):
+    args = parseArgs(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+    try:
+        baseline = loadBaseline(args.baseline)
+    except ValueError as e:
+        logger.error(str(e))
+        return 2
+
+    days = loadDays(args.days)
+    results = []
+    if not args.no_real:
+        inputs = {day.number: args.input.format(day=day.number) if args.input else day.defaultInput() for day in days}
+        results.extend(runSuite("real", days, inputs, args.repeat))
+    if not args.no_synthetic:
+        for scale in args.scale or [1.0]:
+            inputs = syntheticInputs(days, scale, args.seed)
+            results.extend(runSuite(f"synthetic-s{scale:g}", days, inputs, args.repeat))
+
+    reference = baseline["benchmarks"] if baseline else {}
+    verdicts = {r.key: compare(r, reference.get(r.key), args.threshold, args.min_delta)
+                for r in results if r.status == "ok" or r.key in reference}
+    regressions = [key for key, verdict in verdicts.items() if verdict.startswith("REGRESSION")]
+
+    if args.json == "-":
+        print(json.dumps([dict(r.asdict(), baseline=verdicts.get(r.key)) for r in results], indent=2))
+    else:
+        print(formatBench(results, verdicts))
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump([dict(r.asdict(), baseline=verdicts.get(r.key)) for r in results], f, indent=2)
+    if args.save:
+        saveBaseline(args.baseline, results, args.repeat, baseline)
+        print(f"Saved baseline to {args.baseline}", file=sys.stderr)
+    elif regressions:
+        print(f"{len(regressions)} regression(s) against {args.baseline}: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
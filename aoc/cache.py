@@ -0,0 +1,107 @@
+import hashlib
+import json
+import logging
+import os
+import re
+
+from aoc.days import ROOT
+from aoc.runner import PartResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULTCACHEDIR = os.path.join(ROOT, ".aoc_cache")
+DEFAULTCACHESIZE = 16 * 1024 * 1024
+
+
+def fileHash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+SHAREDIMPORTREGEX = re.compile(rb"^\s*from aoc\.(\w+) import", re.MULTILINE)
+
+
+def sourceHash(day) -> str:
+    # the sources of the day and the shared modules it imports,
+    # so editing one solver invalidates only its own results
+    digest = hashlib.sha256()
+    shared = set()
+    for source in day.sources:
+        with open(source, "rb") as f:
+            content = f.read()
+        digest.update(os.path.basename(source).encode())
+        digest.update(content)
+        shared.update(SHAREDIMPORTREGEX.findall(content))
+    for module in sorted(shared):
+        with open(os.path.join(ROOT, "aoc", module.decode() + ".py"), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    # content-addressed on-disk cache of part results, evicts least recently used entries
+    def __init__(self, directory: str = DEFAULTCACHEDIR, maxsize: int = DEFAULTCACHESIZE):
+        self.directory = directory
+        self.maxsize = maxsize
+        self.sourcehashes = {}
+        os.makedirs(self.directory, exist_ok=True)
+        self.evict()
+
+    def key(self, day, part: int, inputhash: str) -> str:
+        if day.number not in self.sourcehashes:
+            self.sourcehashes[day.number] = sourceHash(day)
+        return hashlib.sha256(f"{day.number}:{part}:{inputhash}:{self.sourcehashes[day.number]}".encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, day, part: int, inputhash: str) -> PartResult:
+        path = self._path(self.key(day, part, inputhash))
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        os.utime(path)  # mark as recently used
+        result = PartResult(day.number, part, entry["status"], result=entry["result"],
+                            wall=entry["wall"], cpu=entry["cpu"], error=entry["error"])
+        result.cached = True
+        # the measurements of the run which filled the cache
+        result.peakrss = entry.get("peakrss")
+        result.allocated = entry.get("allocated")
+        result.liveblocks = entry.get("liveblocks")
+        result.gcpause = entry.get("gcpause")
+        return result
+
+    def put(self, day, part: int, inputhash: str, result: PartResult):
+        if result.status != "ok":
+            return
+        path = self._path(self.key(day, part, inputhash))
+        tmppath = f"{path}.{os.getpid()}.tmp"
+        with open(tmppath, "w") as f:
+            json.dump(result.asdict(), f)
+        os.replace(tmppath, path)
+        self.evict()
+
+    def evict(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            stat = os.stat(os.path.join(self.directory, name))
+            entries.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for (_, size, _) in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.maxsize:
+                break
+            logger.debug(f"Evicting {name} from result cache")
+            os.remove(os.path.join(self.directory, name))
+            total -= size
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                os.remove(os.path.join(self.directory, name))
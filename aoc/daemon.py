@@ -0,0 +1,200 @@
+import argparse
+import json
+import logging
+import os
+import signal
+import socket
+import socketserver
+import sys
+import time
+
+from aoc.days import DAYS, PARTS, ROOT, Day, loadDays
+from aoc.runner import ParsedInput, PartResult, readInput, runPart
+
+logger = logging.getLogger(__name__)
+
+DEFAULTSOCKET = os.path.join(ROOT, ".aoc_daemon.sock")
+
+# per worker process, loaded by the initializer so the first request does not pay for the imports
+_days = {}
+
+
+def warmUp():
+    for day in loadDays():
+        _days[day.number] = day
+    try:
+        # day24 imports z3 only inside part2
+        import z3  # noqa: F401
+    except ImportError:
+        pass
+
+
+def ping():
+    return os.getpid()
+
+
+def solveRequest(daynumber: int, parts, path: str = None, text: str = None) -> list[PartResult]:
+    day = _days.get(daynumber) or Day(daynumber)
+    if path is not None:
+        if not os.path.isfile(path):
+            return [PartResult(daynumber, part, "noinput", error=f"{path} not found") for part in parts]
+        lines = readInput(path)
+    else:
+        lines = text.splitlines(keepends=True)
+    parsed = ParsedInput(lines)
+    return [runPart(day, part, parsed) for part in parts]
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    # one JSON object per line in both directions, a connection may send any number of requests
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                response = self.server.solve(json.loads(line))
+            except (ValueError, KeyError, TypeError) as e:
+                response = {"error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class SolverServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    # connections are handled on threads, the solving happens on the process pool
+    daemon_threads = True
+
+    def __init__(self, path: str, numworkers: int):
+        self.path = path
+        self.numworkers = numworkers
+        self.executor = self.startWorkers()
+        if os.path.exists(path):
+            os.unlink(path)
+        super().__init__(path, RequestHandler)
+
+    def startWorkers(self):
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=self.numworkers, initializer=warmUp)
+        # the pool starts its workers on demand, make all of them load the days right away
+        pids = {future.result() for future in [executor.submit(ping) for _ in range(self.numworkers)]}
+        logger.info(f"Started {len(pids)} warm workers")
+        return executor
+
+    def solve(self, request: dict) -> dict:
+        # malformed requests raise ValueError, KeyError or TypeError, failures of the workers become an error reply
+        from concurrent.futures.process import BrokenProcessPool
+        if not isinstance(request, dict):
+            raise TypeError(f"a request must be a JSON object, not {type(request).__name__}")
+        daynumber = int(request["day"])
+        if daynumber not in DAYS:
+            raise ValueError(f"No such day: {daynumber}")
+        parts = PARTS if request.get("part") is None else (int(request["part"]),)
+        if any(part not in PARTS for part in parts):
+            raise ValueError(f"No such part: {request['part']}")
+        if ("path" in request) == ("input" in request):
+            raise KeyError("either 'path' or 'input' is required")
+        for field in ("path", "input"):
+            if field in request and not isinstance(request[field], str):
+                raise TypeError(f"'{field}' must be a string, not {type(request[field]).__name__}")
+        start = time.perf_counter()
+        try:
+            future = self.executor.submit(solveRequest, daynumber, parts, request.get("path"), request.get("input"))
+            results = future.result()
+        except BrokenProcessPool as e:
+            # a worker died, e.g. killed for running out of memory, the pool can not be used any more
+            logger.error(f"Worker pool broken while solving day {daynumber}, restarting it")
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = self.startWorkers()
+            return {"error": f"{type(e).__name__}: {e}"}
+        except Exception as e:
+            logger.exception(f"Day {daynumber:02d} failed in the worker")
+            return {"error": f"{type(e).__name__}: {e}"}
+        return {"day": daynumber, "results": [r.asdict() for r in results], "elapsed": time.perf_counter() - start}
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(cancel_futures=True)
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+
+def request(path: str, payload: dict) -> dict:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        sock.sendall(json.dumps(payload).encode() + b"\n")
+        with sock.makefile("rb") as f:
+            return json.loads(f.readline())
+
+
+def terminate(signum, frame):
+    # unwinds serve_forever in the main thread, so server_close removes the socket
+    raise SystemExit(0)
+
+
+def serve(args):
+    server = SolverServer(args.socket, args.jobs or os.cpu_count())
+    logger.warning(f"Serving on {args.socket}")
+    signal.signal(signal.SIGTERM, terminate)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+def solve(args):
+    payload = {"day": args.day, "part": args.part}
+    if args.input == "-":
+        payload["input"] = sys.stdin.read()
+    else:
+        # the daemon has its own working directory
+        payload["path"] = os.path.abspath(args.input)
+    try:
+        response = request(args.socket, payload)
+    except (FileNotFoundError, ConnectionRefusedError):
+        logger.error(f"No daemon listening on {args.socket}, start one with 'python -m aoc.daemon serve'")
+        return 2
+    if "error" in response:
+        logger.error(response["error"])
+        return 2
+    failed = False
+    for result in response["results"]:
+        if result["status"] == "ok":
+            print(f"Part {result['part']}: {result['result']}")
+        else:
+            print(f"Part {result['part']}: {result['status']} {result['error'] or ''}".rstrip())
+            failed = failed or result["status"] == "error"
+    return 1 if failed else 0
+
+
+def parseArgs(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m aoc.daemon",
+                                     description="Serve solver requests from warm processes over a Unix socket.")
+    parser.add_argument("-s", "--socket", default=DEFAULTSOCKET, help=f"socket path (default: {DEFAULTSOCKET})")
+    parser.add_argument("-v", "--verbose", action="store_true", help="show the log output of the solvers")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serveparser = commands.add_parser("serve", help="start the daemon")
+    serveparser.add_argument("-j", "--jobs", type=int, default=0,
+                             help="number of worker processes, 0 for one per CPU (default: 0)")
+    solveparser = commands.add_parser("solve", help="send one request to a running daemon")
+    solveparser.add_argument("day", type=int)
+    solveparser.add_argument("input", nargs="?", default="input.txt", help="input file, '-' for stdin (default: input.txt)")
+    solveparser.add_argument("-p", "--part", type=int, choices=PARTS, help="only solve this part")
+    args = parser.parse_args(argv)
+    if args.command == "serve" and args.jobs < 0:
+        parser.error("--jobs must not be negative")
+    if args.command == "solve" and args.day not in DAYS:
+        parser.error(f"No such day: {args.day}")
+    return args
+
+
+def main(argv=None):
+    args = parseArgs(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+    return serve(args) if args.command == "serve" else solve(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
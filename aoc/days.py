@@ -0,0 +1,83 @@
+import importlib.util
+import logging
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DAYS = range(1, 26)
+PARTS = (1, 2)
+
+
+def dayDirectory(number: int) -> str:
+    return os.path.join(ROOT, f"day{number:02d}")
+
+
+def daySources(number: int) -> list[str]:
+    directory = dayDirectory(number)
+    return sorted(os.path.join(directory, f) for f in os.listdir(directory) if f.endswith(".py"))
+
+
+def moduleName(number: int, source: str) -> str:
+    stem = os.path.splitext(os.path.basename(source))[0]
+    return f"day{number:02d}_{stem}"
+
+
+def setLogLevel(number: int, level: int):
+    # the solvers log to getLogger(__name__), which works before their modules are loaded
+    for source in daySources(number):
+        logging.getLogger(moduleName(number, source)).setLevel(level)
+
+
+def loadModule(path: str, name: str):
+    # day directories are not packages, so load the solver straight from its file
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+class Day:
+    def __init__(self, number: int):
+        assert number in DAYS, f"No such day: {number}"
+        self.number = number
+        self.directory = dayDirectory(number)
+        self.sources = daySources(number)
+        self.modules = []
+        self.parts = {}
+        # optional parse(lines) hook, its result is passed to both parts instead of the lines
+        self.parse = None
+        # parts listed in a module's STREAMING accept any iterable of lines and only pass over it once
+        self.streaming = set()
+        # parts listed in CHUNKED sum over independent lines, so any split of the lines can be solved separately
+        self.chunked = set()
+        for source in self.sources:
+            module = loadModule(source, moduleName(number, source))
+            self.modules.append(module)
+            if self.parse is None and callable(getattr(module, "parse", None)):
+                self.parse = module.parse
+            self.streaming.update(getattr(module, "STREAMING", ()))
+            self.chunked.update(getattr(module, "CHUNKED", ()))
+            for part in PARTS:
+                fun = getattr(module, f"part{part}", None)
+                if callable(fun):
+                    self.parts.setdefault(part, fun)
+
+    def defaultInput(self) -> str:
+        return os.path.join(self.directory, "input.txt")
+
+    def __str__(self):
+        return f"Day {self.number:02d} ({len(self.parts)} parts)"
+
+    def __repr__(self):
+        return self.__str__()
+
+
+def loadDays(numbers=None) -> list[Day]:
+    return [Day(number) for number in (numbers or DAYS)]
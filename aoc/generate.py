@@ -0,0 +1,581 @@
+import argparse
+import math
+import random
+import string
+import sys
+
+from aoc.days import DAYS
+
+# Synthetic puzzle inputs. scale multiplies the amount of data (lines, items or grid cells)
+# relative to an official input, so grids grow by sqrt(scale) per side.
+
+
+def count(base: int, scale: float, minimum: int = 1) -> int:
+    return max(minimum, round(base * scale))
+
+
+def side(base: int, scale: float, minimum: int = 1) -> int:
+    return max(minimum, round(base * math.sqrt(scale)))
+
+
+def uniqueNames(rng, number: int, length: int = 3, alphabet: str = string.ascii_lowercase, exclude=()) -> list[str]:
+    while len(alphabet) ** length < number + len(exclude):
+        length += 1
+    names = set()
+    exclude = set(exclude)
+    while len(names) < number:
+        name = "".join(rng.choices(alphabet, k=length))
+        if name not in exclude:
+            names.add(name)
+    return list(names)
+
+
+def gridToText(rows) -> str:
+    return "".join("".join(row) + "\n" for row in rows)
+
+
+def spanningTree(rng, height: int, width: int, fill: float = 1.0):
+    # random DFS tree over (a fraction of) the cells of a height x width grid
+    start = (rng.randrange(height), rng.randrange(width))
+    visited = {start}
+    stack = [start]
+    edges = []
+    target = max(1, int(height * width * fill))
+    while stack and len(visited) < target:
+        y, x = stack[-1]
+        options = [(ny, nx) for ny, nx in ((y + 1, x), (y - 1, x), (y, x + 1), (y, x - 1))
+                   if 0 <= ny < height and 0 <= nx < width and (ny, nx) not in visited]
+        if not options:
+            stack.pop()
+            continue
+        neighbor = rng.choice(options)
+        visited.add(neighbor)
+        edges.append(((y, x), neighbor))
+        stack.append(neighbor)
+    return visited, edges
+
+
+def treeLoop(rng, height: int, width: int, fill: float = 1.0) -> dict:
+    # simple closed loop on a (3 * height) x (3 * width) grid which runs around a random spanning tree,
+    # every 3x3 block of the tree is a ring with one enclosed tile, neighboring rings are merged along tree edges
+    blocks, treeedges = spanningTree(rng, height, width, fill)
+    edges = set()
+    ring = [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (2, 1), (2, 0), (1, 0)]
+    for i, j in blocks:
+        tiles = [(3 * i + dy, 3 * j + dx) for dy, dx in ring]
+        edges.update(frozenset(pair) for pair in zip(tiles, tiles[1:] + tiles[:1]))
+    for (i1, j1), (i2, j2) in treeedges:
+        (i1, j1), (i2, j2) = sorted(((i1, j1), (i2, j2)))
+        y, x = 3 * i1, 3 * j1
+        if i1 == i2:
+            # cut the lower segments of the facing sides and bridge them
+            edges -= {frozenset(((y + 1, x + 2), (y + 2, x + 2))), frozenset(((y + 1, x + 3), (y + 2, x + 3)))}
+            edges |= {frozenset(((y + 1, x + 2), (y + 1, x + 3))), frozenset(((y + 2, x + 2), (y + 2, x + 3)))}
+        else:
+            # cut the right segments of the facing sides and bridge them
+            edges -= {frozenset(((y + 2, x + 1), (y + 2, x + 2))), frozenset(((y + 3, x + 1), (y + 3, x + 2)))}
+            edges |= {frozenset(((y + 2, x + 1), (y + 3, x + 1))), frozenset(((y + 2, x + 2), (y + 3, x + 2)))}
+    adjacency = {}
+    for edge in edges:
+        p, q = tuple(edge)
+        adjacency.setdefault(p, []).append(q)
+        adjacency.setdefault(q, []).append(p)
+    return adjacency
+
+
+def walkLoop(adjacency: dict) -> list:
+    start = min(adjacency)
+    loop = [start]
+    previous, current = start, adjacency[start][0]
+    while current != start:
+        loop.append(current)
+        previous, current = current, next(n for n in adjacency[current] if n != previous)
+    return loop
+
+
+def day01(rng, scale):
+    words = "one two three four five six seven eight nine".split()
+    lines = []
+    for _ in range(count(1000, scale)):
+        tokens = [rng.choice(string.digits[1:])]
+        for _ in range(rng.randint(1, 8)):
+            r = rng.random()
+            if r < 0.3:
+                tokens.append(rng.choice(words))
+            elif r < 0.5:
+                tokens.append(rng.choice(string.digits[1:]))
+            else:
+                tokens.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 5))))
+        rng.shuffle(tokens)
+        lines.append("".join(tokens))
+    return "".join(line + "\n" for line in lines)
+
+
+def day02(rng, scale):
+    lines = []
+    for game in range(1, count(100, scale) + 1):
+        draws = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(["red", "green", "blue"], k=rng.randint(1, 3))
+            draws.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in colors))
+        lines.append(f"Game {game}: " + "; ".join(draws) + "\n")
+    return "".join(lines)
+
+
+def day03(rng, scale):
+    size = side(140, scale, minimum=10)
+    symbols = "*#+$/@=%&-"
+    rows = []
+    for _ in range(size):
+        row = ["."] * size
+        x = 0
+        while x < size:
+            r = rng.random()
+            if r < 0.1:
+                digits = str(rng.randint(1, 999))
+                if x + len(digits) <= size:
+                    row[x:x + len(digits)] = digits
+                x += len(digits) + 1
+            elif r < 0.14:
+                row[x] = rng.choice(symbols)
+                x += 1
+            else:
+                x += 1
+        rows.append(row)
+    return gridToText(rows)
+
+
+def day04(rng, scale):
+    numcards = count(200, scale)
+    width = len(str(numcards))
+    lines = []
+    for card in range(1, numcards + 1):
+        winning = rng.sample(range(1, 100), 10)
+        have = rng.sample(range(1, 100), 25)
+        lines.append(f"Card {card:>{width}}: " + " ".join(f"{n:>2}" for n in winning)
+                     + " | " + " ".join(f"{n:>2}" for n in have) + "\n")
+    return "".join(lines)
+
+
+def day05(rng, scale):
+    chain = ["seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location"]
+    limit = 2 ** 32
+    seeds = []
+    for _ in range(count(10, scale)):
+        start = rng.randrange(limit // 2)
+        seeds.extend((start, rng.randint(1, limit // 16)))
+    out = ["seeds: " + " ".join(map(str, seeds)) + "\n"]
+    for source, dest in zip(chain, chain[1:]):
+        out.append(f"\n{source}-to-{dest} map:\n")
+        breakpoints = sorted(rng.sample(range(limit), 2 * count(30, scale)))
+        for start, end in zip(breakpoints[0::2], breakpoints[1::2]):
+            out.append(f"{rng.randrange(limit - (end - start))} {start} {end - start}\n")
+    return "".join(out)
+
+
+def day06(rng, scale):
+    times, distances = [], []
+    for _ in range(count(4, scale)):
+        time = rng.randint(7, 99)
+        best = (time // 2) * (time - time // 2)
+        times.append(time)
+        distances.append(rng.randint(best // 3, best - 1))
+    return ("Time:     " + " ".join(f"{t:>4}" for t in times) + "\n"
+            + "Distance: " + " ".join(f"{d:>4}" for d in distances) + "\n")
+
+
+def day07(rng, scale):
+    return "".join(f"{''.join(rng.choices('AKQJT98765432', k=5))} {rng.randint(1, 1000)}\n"
+                   for _ in range(count(1000, scale)))
+
+
+def primes(lower: int, upper: int) -> list[int]:
+    return [n for n in range(max(2, lower), upper) if all(n % d for d in range(2, math.isqrt(n) + 1))]
+
+
+def day08(rng, scale):
+    # every ghost runs through two parallel lanes of a ring whose length is a prime p,
+    # so its Z node is hit exactly every p steps regardless of the instructions.
+    # Node names are limited to 3 letters, so the instructions grow as well as the number of ghosts.
+    instructionlength = primes(side(263, scale), side(263, scale) + 1000)[0]
+    alphabet = string.ascii_uppercase + string.digits
+    inner = [c for c in alphabet if c not in "AZ"]
+    numghosts = side(6, scale)
+    if numghosts > len(alphabet) ** 2 - 2:
+        raise ValueError(f"Scale {scale} needs more ghosts than 3 letter names allow")
+    candidates = [p for p in primes(43, 400) if p != instructionlength]
+    if numghosts <= len(candidates):
+        ringprimes = rng.sample(candidates, k=numghosts)
+    else:
+        ringprimes = rng.choices(candidates, k=numghosts)
+    totalnodes = sum(2 * (p - 1) for p in ringprimes)
+    capacity = len(alphabet) ** 2 * len(inner)
+    if totalnodes > capacity:
+        raise ValueError(f"Scale {scale} needs more nodes than 3 letter names allow")
+    names = iter(alphabet[i // (len(alphabet) * len(inner))] + alphabet[i // len(inner) % len(alphabet)] + inner[i % len(inner)]
+                 for i in rng.sample(range(capacity), totalnodes))
+    prefixes = ["AA"] + uniqueNames(rng, numghosts - 1, length=2, alphabet=alphabet, exclude=("AA", "ZZ"))
+
+    nodes = []
+    for prefix, p in zip(prefixes, ringprimes):
+        start, end = (prefix + "A", prefix + "Z") if prefix != "AA" else ("AAA", "ZZZ")
+        lanes = [[next(names) for _ in range(p - 1)] for _ in range(2)]
+        # start -> lane position 1 -> ... -> lane position p - 1 -> end -> lane position 1
+        nodes.append((start, lanes[0][0], lanes[1][0]))
+        nodes.append((end, lanes[0][0], lanes[1][0]))
+        for i in range(p - 1):
+            left, right = (lanes[0][i + 1], lanes[1][i + 1]) if i + 1 < p - 1 else (end, end)
+            nodes.append((lanes[0][i], left, right))
+            nodes.append((lanes[1][i], left, right))
+    rng.shuffle(nodes)
+    instructions = "".join(rng.choices("LR", k=instructionlength))
+    return instructions + "\n\n" + "".join(f"{name} = ({left}, {right})\n" for name, left, right in nodes)
+
+
+def day09(rng, scale):
+    lines = []
+    for _ in range(count(200, scale)):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 7))]
+        values = [sum(c * x ** i for i, c in enumerate(coefficients)) for x in range(21)]
+        lines.append(" ".join(map(str, values)) + "\n")
+    return "".join(lines)
+
+
+PIPES = {frozenset("NS"): "|", frozenset("EW"): "-", frozenset("NE"): "L",
+         frozenset("NW"): "J", frozenset("SW"): "7", frozenset("SE"): "F"}
+
+
+def direction(source, target) -> str:
+    dy, dx = target[0] - source[0], target[1] - source[1]
+    return {(-1, 0): "N", (1, 0): "S", (0, 1): "E", (0, -1): "W"}[(dy, dx)]
+
+
+def day10(rng, scale):
+    blocks = side(46, scale, minimum=2)
+    adjacency = treeLoop(rng, blocks, blocks, fill=0.6)
+    size = 3 * blocks
+    rows = [[rng.choice("|-LJ7F.") for _ in range(size)] for _ in range(size)]
+    for tile, neighbors in adjacency.items():
+        rows[tile[0]][tile[1]] = PIPES[frozenset(direction(tile, n) for n in neighbors)]
+    sy, sx = rng.choice(list(adjacency))
+    rows[sy][sx] = "S"
+    # junk next to S must not point at it, S connects to anything
+    for ny, nx in ((sy - 1, sx), (sy + 1, sx), (sy, sx - 1), (sy, sx + 1)):
+        if 0 <= ny < size and 0 <= nx < size and (ny, nx) not in adjacency:
+            rows[ny][nx] = "."
+    return gridToText(rows)
+
+
+def day11(rng, scale):
+    size = side(140, scale, minimum=5)
+    emptyrows = set(rng.sample(range(size), size // 20))
+    emptycols = set(rng.sample(range(size), size // 20))
+    rows = [["#" if y not in emptyrows and x not in emptycols and rng.random() < 0.02 else "." for x in range(size)]
+            for y in range(size)]
+    return gridToText(rows)
+
+
+def day12(rng, scale):
+    lines = []
+    for _ in range(count(1000, scale)):
+        springs = [rng.choice("..#") for _ in range(rng.randint(5, 20))]
+        springs[rng.randrange(len(springs))] = "#"
+        record = [len(run) for run in "".join(springs).split(".") if run]
+        masked = "".join("?" if rng.random() < 0.4 else c for c in springs)
+        lines.append(f"{masked} {','.join(map(str, record))}\n")
+    return "".join(lines)
+
+
+def reflectionDifferences(rows, axis) -> list[int]:
+    # number of differing cells for every horizontal reflection line of rows
+    if axis == 1:
+        rows = list(zip(*rows))
+    differences = []
+    for y in range(1, len(rows)):
+        height = min(y, len(rows) - y)
+        differences.append(sum(a != b for i in range(height) for a, b in zip(rows[y - 1 - i], rows[y + i])))
+    return differences
+
+
+def day13(rng, scale):
+    patterns = []
+    while len(patterns) < count(100, scale):
+        height, width = rng.randint(7, 17), rng.randint(7, 17)
+        cells = [(y, x) for y in range(height) for x in range(width)]
+        parent = {cell: cell for cell in cells}
+
+        def find(cell):
+            while parent[cell] != cell:
+                parent[cell] = parent[parent[cell]]
+                cell = parent[cell]
+            return cell
+
+        def mirrorpairs(axis, line):
+            size = height if axis == 0 else width
+            reach = min(line, size - line)
+            for i in range(reach):
+                for other in range(width if axis == 0 else height):
+                    if axis == 0:
+                        yield (line - 1 - i, other), (line + i, other)
+                    else:
+                        yield (other, line - 1 - i), (other, line + i)
+
+        # a perfect reflection for part 1 and one with a single smudge for part 2
+        (axis1, line1), (axis2, line2) = [(axis, rng.randint(1, (height if axis == 0 else width) - 1))
+                                          for axis in (rng.randint(0, 1), rng.randint(0, 1))]
+        if (axis1, line1) == (axis2, line2):
+            continue
+        smudgepairs = list(mirrorpairs(axis2, line2))
+        smudge = rng.choice(smudgepairs)
+        for p, q in list(mirrorpairs(axis1, line1)) + [pair for pair in smudgepairs if pair != smudge]:
+            parent[find(p)] = find(q)
+        if find(smudge[0]) == find(smudge[1]):
+            continue
+        values = {}
+        for cell in cells:
+            values.setdefault(find(cell), rng.choice("#."))
+        rows = [[values[find((y, x))] for x in range(width)] for y in range(height)]
+        rows[smudge[1][0]][smudge[1][1]] = "#" if rows[smudge[0][0]][smudge[0][1]] == "." else "."
+        differences = reflectionDifferences(rows, 0) + reflectionDifferences(rows, 1)
+        if differences.count(0) == 1 and differences.count(1) == 1:
+            patterns.append(gridToText(rows))
+    return "\n".join(patterns)
+
+
+def day14(rng, scale):
+    size = side(100, scale, minimum=5)
+    return gridToText([rng.choices("O#.", weights=(0.2, 0.1, 0.7), k=size) for _ in range(size)])
+
+
+def day15(rng, scale):
+    labels = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6))) for _ in range(count(500, scale))]
+    steps = []
+    for _ in range(count(4000, scale)):
+        label = rng.choice(labels)
+        steps.append(f"{label}-" if rng.random() < 0.3 else f"{label}={rng.randint(1, 9)}")
+    return ",".join(steps) + "\n"
+
+
+def day16(rng, scale):
+    size = side(110, scale, minimum=5)
+    return gridToText([rng.choices(".\\/|-", weights=(0.9, 0.025, 0.025, 0.025, 0.025), k=size) for _ in range(size)])
+
+
+def day17(rng, scale):
+    size = side(141, scale, minimum=5)
+    return gridToText([rng.choices("123456789", k=size) for _ in range(size)])
+
+
+def day18(rng, scale):
+    # dig along the loop around a random tree, stretched by monotone coordinate maps,
+    # one with small steps for part 1 and one with large steps for the hex encoded part 2
+    blocks = side(13, scale, minimum=2)
+    loop = walkLoop(treeLoop(rng, blocks, blocks))
+    size = 3 * blocks
+    segments = []
+    for tile, nexttile in zip(loop, loop[1:] + loop[:1]):
+        step = direction(tile, nexttile)
+        if segments and segments[-1][0] == step:
+            segments[-1][2] = nexttile
+        else:
+            segments.append([step, tile, nexttile])
+
+    def coordinates(maxwidth):
+        out = [0]
+        for _ in range(size):
+            out.append(out[-1] + rng.randint(1, maxwidth))
+        return out
+
+    longest = max(abs(a[0] - b[0]) + abs(a[1] - b[1]) for (_, a, b) in segments)
+    smally, smallx = coordinates(10), coordinates(10)
+    largey, largex = coordinates(0xFFFFF // longest), coordinates(0xFFFFF // longest)
+    codes = {"R": 0, "D": 1, "L": 2, "U": 3}
+    lines = []
+    for step, (y1, x1), (y2, x2) in segments:
+        small = abs(smally[y2] - smally[y1]) + abs(smallx[x2] - smallx[x1])
+        large = abs(largey[y2] - largey[y1]) + abs(largex[x2] - largex[x1])
+        step = {"N": "U", "S": "D", "E": "R", "W": "L"}[step]
+        lines.append(f"{step} {small} (#{large:05x}{codes[step]})\n")
+    return "".join(lines)
+
+
+def day19(rng, scale):
+    # workflows form a tree below 'in', so every part terminates in A or R
+    numworkflows = count(550, scale)
+    names = ["in"] + uniqueNames(rng, numworkflows - 1, length=2, exclude=("in",))
+    children = {name: [] for name in names}
+    for i, name in enumerate(names[1:], start=1):
+        children[names[rng.randrange(max(0, i - 4), i)]].append(name)
+    lines = []
+    for name in names:
+        targets = children[name] + [rng.choice("AR") for _ in range(rng.randint(1, 2))]
+        rng.shuffle(targets)
+        rules = [f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(1, 4000)}:{target}" for target in targets[:-1]]
+        lines.append(f"{name}{{{','.join(rules + [targets[-1]])}}}\n")
+    rng.shuffle(lines)
+    parts = [f"{{x={rng.randint(1, 4000)},m={rng.randint(1, 4000)},a={rng.randint(1, 4000)},s={rng.randint(1, 4000)}}}\n"
+             for _ in range(count(200, scale))]
+    return "".join(lines) + "\n" + "".join(parts)
+
+
+def day20(rng, scale):
+    # broadcaster feeds 12 bit counters which reset at a prime, like the official inputs
+    numcounters = side(4, scale)
+    periods = rng.sample(primes(2049, 4096), k=numcounters)
+    names = iter(uniqueNames(rng, numcounters * 14 + 1, length=2, exclude=("rx",)))
+    final = next(names)
+    lines = {}
+    broadcast = []
+    inverters = []
+    for period in periods:
+        flipflops = [next(names) for _ in range(12)]
+        hub, inverter = next(names), next(names)
+        broadcast.append(flipflops[0])
+        inverters.append(inverter)
+        hubtargets = [inverter]
+        for bit, flipflop in enumerate(flipflops):
+            targets = [flipflops[bit + 1]] if bit + 1 < 12 else []
+            if period >> bit & 1:
+                targets.append(hub)
+            if not period >> bit & 1 or bit == 0:
+                hubtargets.append(flipflop)
+            lines[flipflop] = f"%{flipflop} -> {', '.join(targets)}\n"
+        lines[hub] = f"&{hub} -> {', '.join(hubtargets)}\n"
+        lines[inverter] = f"&{inverter} -> {final}\n"
+    lines[final] = f"&{final} -> rx\n"
+    out = [f"broadcaster -> {', '.join(broadcast)}\n"] + list(lines.values())
+    rng.shuffle(out)
+    return "".join(out)
+
+
+def day21(rng, scale):
+    size = side(131, scale, minimum=131) | 1
+    center = size // 2
+    rows = [["#" if rng.random() < 0.12 else "." for _ in range(size)] for _ in range(size)]
+    for i in range(size):
+        # the official inputs have a clear middle cross and border
+        rows[center][i] = rows[i][center] = "."
+        rows[0][i] = rows[size - 1][i] = rows[i][0] = rows[i][size - 1] = "."
+    rows[center][center] = "S"
+    return gridToText(rows)
+
+
+def day22(rng, scale):
+    footprint = side(10, scale, minimum=3)
+    bricks = []
+    z = 1
+    for _ in range(count(1400, scale)):
+        x, y = rng.randrange(footprint), rng.randrange(footprint)
+        length = rng.randint(1, 4)
+        match rng.randrange(3):
+            case 0:
+                end = (min(footprint - 1, x + length - 1), y, z)
+            case 1:
+                end = (x, min(footprint - 1, y + length - 1), z)
+            case _:
+                end = (x, y, z + length - 1)
+        bricks.append(f"{x},{y},{z}~{end[0]},{end[1]},{end[2]}\n")
+        z = end[2] + rng.randint(1, 3)
+    rng.shuffle(bricks)
+    return "".join(bricks)
+
+
+def day23(rng, scale):
+    # a fixed 6 x 6 lattice of junctions, only the corridors get longer with scale,
+    # more junctions would make the longest path search of part 2 explode
+    junctions = 6
+    spacing = side(22, scale, minimum=4)
+    ys, xs = [1], [1]
+    for _ in range(junctions - 1):
+        ys.append(ys[-1] + rng.randint(spacing // 2 + 2, spacing + 2))
+        xs.append(xs[-1] + rng.randint(spacing // 2 + 2, spacing + 2))
+    height, width = ys[-1] + 2, xs[-1] + 2
+    rows = [["#"] * width for _ in range(height)]
+    for y in ys:
+        for x in range(xs[0], xs[-1] + 1):
+            rows[y][x] = "."
+    for x in xs:
+        for y in range(ys[0], ys[-1] + 1):
+            rows[y][x] = "."
+    # slopes around every junction only allow walking right and down
+    for y in ys:
+        for x in xs:
+            for dy, dx, slope in ((0, 1, ">"), (0, -1, ">"), (1, 0, "v"), (-1, 0, "v")):
+                if ys[0] <= y + dy <= ys[-1] and xs[0] <= x + dx <= xs[-1]:
+                    rows[y + dy][x + dx] = slope
+    rows[0][xs[0]] = "."
+    rows[height - 1][xs[-1]] = "."
+    for y in range(ys[-1] + 1, height):
+        rows[y][xs[-1]] = "."
+    return gridToText(rows)
+
+
+def day24(rng, scale):
+    # all hailstones are hit by one rock at integer times
+    rock = [rng.randint(250_000_000_000_000, 350_000_000_000_000) for _ in range(3)]
+    rockvelocity = [rng.randint(-100, 100) for _ in range(3)]
+    times = rng.sample(range(1, 500_000_000_000), count(300, scale))
+    lines = []
+    for t in times:
+        velocity = [v + rng.choice([-1, 1]) * rng.randint(1, 250) for v in rockvelocity]
+        velocity = [v if v != 0 else 1 for v in velocity]
+        position = [p + t * (rv - v) for p, rv, v in zip(rock, rockvelocity, velocity)]
+        lines.append(", ".join(map(str, position)) + " @ " + ", ".join(map(str, velocity)) + "\n")
+    return "".join(lines)
+
+
+def day25(rng, scale):
+    # two well connected halves joined by exactly three edges
+    numnodes = count(1500, scale, minimum=20)
+    names = uniqueNames(rng, numnodes)
+    halves = [names[:numnodes // 2], names[numnodes // 2:]]
+    edges = set()
+    for half in halves:
+        for i in range(1, len(half)):
+            for other in rng.sample(half[:i], k=min(i, 4)):
+                edges.add((half[i], other))
+    for _ in range(3):
+        while True:
+            edge = (rng.choice(halves[0]), rng.choice(halves[1]))
+            if edge not in edges:
+                edges.add(edge)
+                break
+    connections = {}
+    for a, b in edges:
+        connections.setdefault(a, []).append(b)
+    lines = [f"{name}: {' '.join(targets)}\n" for name, targets in connections.items()]
+    rng.shuffle(lines)
+    return "".join(lines)
+
+
+GENERATORS = {number: globals()[f"day{number:02d}"] for number in DAYS}
+
+
+def generate(day: int, scale: float = 1.0, seed: int = 0) -> str:
+    return GENERATORS[day](random.Random(f"{day}:{seed}"), scale)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m aoc.generate", description="Generate synthetic puzzle inputs.")
+    parser.add_argument("days", nargs="*", type=int, help="days to generate (default: all)")
+    parser.add_argument("-s", "--scale", type=float, default=1.0,
+                        help="size relative to an official input, grids grow by sqrt(scale) per side (default: 1)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="output path template, e.g. 'synthetic/day{day:02d}.txt' (default: stdout)")
+    args = parser.parse_args(argv)
+    for day in args.days or DAYS:
+        if day not in DAYS:
+            parser.error(f"No such day: {day}")
+        text = generate(day, args.scale, args.seed)
+        if args.output:
+            import os
+            path = args.output.format(day=day)
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "w") as f:
+                f.write(text)
+        else:
+            sys.stdout.write(text)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+import numpy as np
+
+NEWLINE = ord("\n")
+CARRIAGERETURN = ord("\r")
+
+
+def gridFromBuffer(buffer) -> np.ndarray:
+    # interpret a buffer of equally long lines as a strided (height, width) uint8 view of it
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    end = len(data)
+    while end > 0 and data[end - 1] in (NEWLINE, CARRIAGERETURN):
+        end -= 1
+    if end == 0:
+        return np.zeros((0, 0), dtype=np.uint8)
+    data = data[:end]
+
+    newlines = np.flatnonzero(data == NEWLINE)
+    width = int(newlines[0]) if len(newlines) > 0 else end
+    stride = width + 1
+    if width > 0 and data[width - 1] == CARRIAGERETURN:
+        width -= 1
+    height = len(newlines) + 1
+    if len(data) != (height - 1) * stride + width or np.any(newlines != np.arange(1, height) * stride - 1):
+        raise ValueError("Grid lines are not all of the same length")
+    return np.lib.stride_tricks.as_strided(data, shape=(height, width), strides=(stride, 1), writeable=False)
+
+
+def gridFromLines(lines) -> np.ndarray:
+    if not lines:
+        return np.zeros((0, 0), dtype=np.uint8)
+    # one copy of the input into a single buffer, the grid is a view of it
+    separator = "" if lines[0].endswith("\n") else "\n"
+    return gridFromBuffer(separator.join(lines).encode("ascii"))
+
+
+def translationTable(mapping: dict, default=0, dtype=np.uint8) -> np.ndarray:
+    # lookup table from input bytes to a day specific encoding, mapping keys may be chars or strings of chars
+    table = np.full(256, default, dtype=dtype)
+    for chars, value in mapping.items():
+        for char in chars:
+            table[ord(char)] = value
+    return table
+
+
+DIGITS = translationTable({str(d): d for d in range(10)})
+
+
+def translate(grid: np.ndarray, table: np.ndarray) -> np.ndarray:
+    return table[grid]
+
+
+def findChar(grid: np.ndarray, char: str) -> list[tuple[int, int]]:
+    return [tuple(pos) for pos in np.argwhere(grid == ord(char)).tolist()]
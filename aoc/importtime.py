@@ -0,0 +1,118 @@
+import argparse
+import logging
+import os
+import re
+import subprocess
+import sys
+
+from aoc.days import DAYS, ROOT, daySources
+
+logger = logging.getLogger(__name__)
+
+# milliseconds, numpy alone accounts for most of the 90ms of the days using it
+DEFAULTBUDGET = 150.0
+# the cheap days should start as fast as the interpreter allows
+DAYBUDGETS = {1: 40.0, 2: 40.0, 4: 40.0, 6: 40.0, 15: 40.0}
+# ms, the startup imports of a bare interpreter (python -X importtime -c pass) on the machine the budgets were set on.
+# A slower or busier machine scales the budgets by its own baseline over this one.
+REFERENCEBASELINE = 7.0
+
+IMPORTTIMEREGEX = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$")
+
+
+def parseImportTime(stderr: str) -> list[tuple[int, str, int, int]]:
+    # (depth, module, self us, cumulative us) in the order python reports them, children first
+    entries = []
+    for line in stderr.splitlines():
+        match = IMPORTTIMEREGEX.match(line)
+        if match:
+            entries.append((len(match[3]) // 2, match[4], int(match[1]), int(match[2])))
+    return entries
+
+
+def measureBaseline() -> float:
+    # in ms, all imports of a bare interpreter, i.e. what site and the startup pull in
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", "pass"], capture_output=True, text=True,
+                             cwd=ROOT)
+    return sum(cumulative for depth, _, _, cumulative in parseImportTime(process.stderr) if depth == 0) / 1000
+
+
+def measureDay(number: int) -> tuple[float, list[tuple[str, float]]]:
+    # cold import of all modules of a day in a fresh interpreter, in ms, with the heaviest direct imports
+    sources = daySources(number)
+    stems = [os.path.splitext(os.path.basename(source))[0] for source in sources]
+    directory = os.path.dirname(sources[0])
+    code = f"import sys; sys.path.insert(0, {directory!r}); " + "; ".join(f"import {stem}" for stem in stems)
+    # from the repository root, so the days find the shared aoc package
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True,
+                             cwd=ROOT)
+    if process.returncode != 0:
+        raise RuntimeError(f"Importing day {number:02d} failed:\n{process.stderr.strip().splitlines()[-1]}")
+    entries = parseImportTime(process.stderr)
+    total = 0
+    children = []
+    pending = []
+    for depth, module, _, cumulative in entries:
+        if depth == 0 and module in stems:
+            total += cumulative
+            children.extend(pending)
+        if depth == 0:
+            pending = []
+        elif depth == 1:
+            pending.append((module, cumulative / 1000))
+    children.sort(key=lambda child: -child[1])
+    return total / 1000, children
+
+
+def parseArgs(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m aoc.importtime",
+                                     description="Check the cold import time of the day modules against a budget.")
+    parser.add_argument("days", nargs="*", type=int, help="days to check (default: all)")
+    parser.add_argument("-b", "--budget", type=float, help=f"budget in ms for every day (default: {DEFAULTBUDGET:g}, "
+                        + ", ".join(f"day {day}: {budget:g}" for day, budget in DAYBUDGETS.items()) + ")")
+    parser.add_argument("-r", "--repeat", type=int, default=5,
+                        help="fresh interpreters per day and for the baseline, the fastest counts (default: 5)")
+    parser.add_argument("--top", type=int, default=3, help="number of heaviest imports shown per day (default: 3)")
+    args = parser.parse_args(argv)
+    for day in args.days:
+        if day not in DAYS:
+            parser.error(f"No such day: {day}")
+    if args.repeat < 1:
+        parser.error("--repeat must be positive")
+    return args
+
+
+def main(argv=None):
+    args = parseArgs(argv)
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+    overbudget = []
+    for day in args.days or DAYS:
+        budget = args.budget if args.budget is not None else DAYBUDGETS.get(day, DEFAULTBUDGET)
+        try:
+            # the baseline is measured alongside the day, so both see the same machine load
+            runs = []
+            baselines = []
+            for _ in range(args.repeat):
+                baselines.append(measureBaseline())
+                runs.append(measureDay(day))
+        except RuntimeError as e:
+            logger.error(str(e))
+            overbudget.append(day)
+            continue
+        total, children = min(runs, key=lambda run: run[0])
+        # budgets are never tightened below the reference machine
+        scale = max(1.0, min(baselines) / REFERENCEBASELINE)
+        budget *= scale
+        heaviest = ", ".join(f"{module} {ms:.1f}" for module, ms in children[:args.top])
+        verdict = "ok" if total <= budget else "OVER BUDGET"
+        print(f"Day {day:02d}  {total:7.1f} ms / {budget:5.0f} ms  x{scale:.2f}  {verdict:<11}  {heaviest}".rstrip())
+        if total > budget:
+            overbudget.append(day)
+    if overbudget:
+        print(f"{len(overbudget)} day(s) over the import time budget: {', '.join(map(str, overbudget))}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,120 @@
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+def overlaps(first, second) -> bool:
+    # whether two half-open (start, end) intervals share an integer
+    return first[0] < second[1] and second[0] < first[1]
+
+
+class IntervalSet:
+    # A set of integers stored as sorted, disjoint, non-adjacent half-open intervals [start, end).
+    # The bounds live in one flat array start0, end0, start1, end1, ..., so membership is a bisection
+    # and the set operations are a single merge of two bound arrays.
+    def __init__(self, intervals=()):
+        self.bounds = array("q")
+        for start, end in sorted(interval for interval in intervals if interval[0] < interval[1]):
+            if self.bounds and start <= self.bounds[-1]:
+                # overlapping or adjacent, coalesce
+                self.bounds[-1] = max(self.bounds[-1], end)
+            else:
+                self.bounds.append(start)
+                self.bounds.append(end)
+
+    @classmethod
+    def closed(cls, first: int, last: int):
+        # the integers first..last, both included
+        return cls([(first, last + 1)])
+
+    @classmethod
+    def _from_bounds(cls, bounds):
+        intervalset = cls()
+        intervalset.bounds = bounds
+        return intervalset
+
+    def __iter__(self):
+        bounds = self.bounds
+        for i in range(0, len(bounds), 2):
+            yield bounds[i], bounds[i + 1]
+
+    def __len__(self):
+        # number of intervals, see size() for the number of integers
+        return len(self.bounds) // 2
+
+    def __bool__(self):
+        return len(self.bounds) > 0
+
+    def size(self) -> int:
+        bounds = self.bounds
+        return sum(bounds[i + 1] - bounds[i] for i in range(0, len(bounds), 2))
+
+    def min(self) -> int:
+        if not self.bounds:
+            raise ValueError("min() of an empty IntervalSet")
+        return self.bounds[0]
+
+    def max(self) -> int:
+        if not self.bounds:
+            raise ValueError("max() of an empty IntervalSet")
+        return self.bounds[-1] - 1
+
+    def __contains__(self, value: int) -> bool:
+        # inside exactly if an odd number of bounds is <= value
+        return bisect_right(self.bounds, value) % 2 == 1
+
+    def _combine(self, other, keep):
+        # sweep over the bounds of both sets, keep(inself, inother) decides membership between two bounds
+        a, b = self.bounds, other.bounds
+        out = array("q")
+        i = j = 0
+        inside = False
+        while i < len(a) or j < len(b):
+            if j >= len(b) or (i < len(a) and a[i] < b[j]):
+                x = a[i]
+            else:
+                x = b[j]
+            if i < len(a) and a[i] == x:
+                i += 1
+            if j < len(b) and b[j] == x:
+                j += 1
+            now = keep(i % 2 == 1, j % 2 == 1)
+            if now != inside:
+                out.append(x)
+                inside = now
+        return type(self)._from_bounds(out)
+
+    def union(self, other):
+        return self._combine(other, lambda a, b: a or b)
+
+    def intersection(self, other):
+        return self._combine(other, lambda a, b: a and b)
+
+    def difference(self, other):
+        return self._combine(other, lambda a, b: a and not b)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def shift(self, offset: int):
+        return type(self)._from_bounds(array("q", (bound + offset for bound in self.bounds)))
+
+    def split(self, breakpoints):
+        # the intervals cut at every breakpoint inside them, breakpoints must be sorted.
+        # Every piece lies between two consecutive breakpoints, so it can be looked up with one bisection.
+        for start, end in self:
+            first = bisect_right(breakpoints, start)
+            last = bisect_left(breakpoints, end)
+            for cut in breakpoints[first:last]:
+                yield start, cut
+                start = cut
+            yield start, end
+
+    def __eq__(self, other):
+        return isinstance(other, IntervalSet) and self.bounds == other.bounds
+
+    def __str__(self):
+        return "{" + ", ".join(f"[{start}, {end})" for start, end in self) + "}"
+
+    def __repr__(self):
+        return f"IntervalSet({list(self)})"
@@ -0,0 +1,152 @@
+import argparse
+import logging
+import mmap
+import os
+import sys
+import time
+
+from aoc.days import DAYS, PARTS, Day, loadDays
+from aoc.runner import PartResult, formatTable, toJson
+
+logger = logging.getLogger(__name__)
+
+# bytes, smaller chunks are not worth the round trip to a worker
+MINCHUNK = 1 << 20
+# chunks per worker, several so a slow chunk (e.g. long day12 records) does not stall the others
+CHUNKSPERWORKER = 4
+
+
+def splitRanges(path: str, chunksize: int) -> list[tuple[int, int]]:
+    # [start, end) byte ranges of roughly chunksize, every range ends right after a newline (or at the end of the file)
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    ranges = []
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < size:
+            end = min(start + chunksize, size)
+            if end < size:
+                newline = mm.find(b"\n", end - 1)
+                end = size if newline < 0 else newline + 1
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def rangeLines(mm: mmap.mmap, start: int, end: int):
+    # the lines of one range, read lazily from the map so a worker holds one line at a time
+    mm.seek(start)
+    while mm.tell() < end:
+        yield mm.readline().decode()
+
+
+# per worker process: the loaded days and one map per input file
+_days = {}
+_maps = {}
+
+
+def mapRange(daynumber: int, part: int, path: str, start: int, end: int):
+    # partial answer of one part over one range and the CPU time it took
+    cpustart = time.process_time()
+    if daynumber not in _days:
+        _days[daynumber] = Day(daynumber)
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    if key not in _maps:
+        with open(path, "rb") as f:
+            _maps[key] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    day = _days[daynumber]
+    lines = rangeLines(_maps[key], start, end)
+    partial = day.parts[part](day.parse(lines) if day.parse is not None else lines)
+    return partial, time.process_time() - cpustart
+
+
+def runChunked(day, part: int, infile: str, numworkers: int, chunksize: int = None, executor=None) -> PartResult:
+    if part not in day.parts:
+        return PartResult(day.number, part, "missing")
+    if part not in day.chunked:
+        return PartResult(day.number, part, "skipped", error="the answer is not a sum over independent lines")
+    if not os.path.isfile(infile):
+        return PartResult(day.number, part, "noinput", error=f"{infile} not found")
+
+    wallstart = time.perf_counter()
+    size = os.path.getsize(infile)
+    chunksize = chunksize or max(MINCHUNK, size // (numworkers * CHUNKSPERWORKER) + 1)
+    ranges = splitRanges(infile, chunksize)
+    logger.info(f"Day {day.number:02d} part {part}: {len(ranges)} chunks of up to {chunksize} bytes")
+    try:
+        if executor is None:
+            mapped = [mapRange(day.number, part, infile, start, end) for start, end in ranges]
+        else:
+            futures = [executor.submit(mapRange, day.number, part, infile, start, end) for start, end in ranges]
+            mapped = [future.result() for future in futures]
+    except (Exception, SystemExit) as e:
+        logger.exception(f"Day {day.number:02d} part {part} failed")
+        return PartResult(day.number, part, "error", wall=time.perf_counter() - wallstart, error=f"{type(e).__name__}: {e}")
+    result = sum(partial for partial, _ in mapped)
+    cpu = sum(cpu for _, cpu in mapped)
+    return PartResult(day.number, part, "ok", result=result, wall=time.perf_counter() - wallstart, cpu=cpu)
+
+
+def parseArgs(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m aoc.mapreduce",
+                                     description="Solve the parts which sum over independent lines in parallel chunks "
+                                                 "of a (huge) input.")
+    parser.add_argument("days", nargs="*", type=int, help="days to solve (default: all with such parts)")
+    parser.add_argument("-i", "--input", default=None,
+                        help="input path template, e.g. 'inputs/day{day:02d}.txt' (default: dayNN/input.txt)")
+    parser.add_argument("-j", "--jobs", type=int, default=0,
+                        help="number of worker processes, 0 for one per CPU, 1 to run in-process (default: 0)")
+    parser.add_argument("--chunk-size", type=float, default=None,
+                        help=f"chunk size in MiB (default: the input split into {CHUNKSPERWORKER} chunks per worker, "
+                             f"at least {MINCHUNK >> 20} MiB)")
+    parser.add_argument("--json", metavar="FILE", help="also write the results as JSON ('-' for stdout)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="show progress and the log output of the solvers")
+    args = parser.parse_args(argv)
+    for day in args.days:
+        if day not in DAYS:
+            parser.error(f"No such day: {day}")
+    if args.jobs < 0:
+        parser.error("--jobs must not be negative")
+    if args.chunk_size is not None and args.chunk_size <= 0:
+        parser.error("--chunk-size must be positive")
+    return args
+
+
+def main(argv=None):
+    args = parseArgs(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+    start = time.perf_counter()
+    days = [day for day in loadDays(args.days) if args.days or day.chunked]
+    numworkers = args.jobs or os.cpu_count()
+    chunksize = int(args.chunk_size * (1 << 20)) if args.chunk_size else None
+
+    executor = None
+    if numworkers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=numworkers)
+    results = []
+    try:
+        for day in days:
+            infile = args.input.format(day=day.number) if args.input else day.defaultInput()
+            for part in PARTS:
+                results.append(runChunked(day, part, infile, numworkers, chunksize, executor))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    elapsed = time.perf_counter() - start
+
+    if args.json == "-":
+        print(toJson(results))
+    else:
+        print(formatTable(results, elapsed))
+        if args.json:
+            with open(args.json, "w") as f:
+                f.write(toJson(results))
+    return 1 if any(r.status == "error" for r in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+import contextlib
+import io
+import logging
+import os
+import sys
+
+from aoc.runner import formatSize
+
+logger = logging.getLogger(__name__)
+
+DEFAULTPROFILEDIR = "profiles"
+DEFAULTTOP = 15
+
+
+def profiler(directory: str = DEFAULTPROFILEDIR, top: int = DEFAULTTOP, sort: str = "tottime", out=sys.stderr):
+    # hook for runPart: profiles one part, dumps dayNN_partP.pstats and prints the hottest functions
+    import cProfile
+    import pstats
+    os.makedirs(directory, exist_ok=True)
+
+    @contextlib.contextmanager
+    def hook(day: int, part: int):
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            path = os.path.join(directory, f"day{day:02d}_part{part}.pstats")
+            profile.dump_stats(path)
+            stream = io.StringIO()
+            pstats.Stats(profile, stream=stream).strip_dirs().sort_stats(sort).print_stats(top)
+            print(f"=== Day {day:02d} part {part}: profile written to {path}", file=out)
+            # skip the preamble of print_stats, it repeats the file name and the ordering
+            report = stream.getvalue()
+            print(report[report.find("   ncalls"):].rstrip() + "\n", file=out)
+
+    return hook
+
+
+class PeakSnapshot:
+    # profile function which takes a tracemalloc snapshot whenever the traced memory grew by a
+    # factor since the last one, so the reported sites are those alive around the peak and not
+    # what survives the end of the part
+    def __init__(self, growth: float = 1.1, minimum: int = 64 * 1024):
+        import tracemalloc
+        self.tracemalloc = tracemalloc
+        self.growth = growth
+        self.minimum = minimum
+        self.size = 0
+        self.snapshot = None
+
+    def __call__(self, frame, event, arg):
+        if event != "return":
+            return
+        current, _ = self.tracemalloc.get_traced_memory()
+        if current >= self.minimum and current > self.size * self.growth:
+            self.snapshot = self.tracemalloc.take_snapshot()
+            self.size = current
+
+
+def allocationTracer(top: int = DEFAULTTOP, out=sys.stderr):
+    # hook for runPart: reports the peak traced memory of one part and where it was allocated
+    import tracemalloc
+
+    @contextlib.contextmanager
+    def hook(day: int, part: int):
+        peak = PeakSnapshot()
+        # --alloc may already be tracing, then it also stops
+        starttracing = not tracemalloc.is_tracing()
+        if starttracing:
+            tracemalloc.start()
+        previous = sys.getprofile()
+        sys.setprofile(peak)
+        try:
+            yield
+        finally:
+            sys.setprofile(previous)
+            _, peaksize = tracemalloc.get_traced_memory()
+            snapshot = peak.snapshot or tracemalloc.take_snapshot()
+            if starttracing:
+                tracemalloc.stop()
+            snapshot = snapshot.filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),
+                                               tracemalloc.Filter(False, __file__),
+                                               tracemalloc.Filter(False, contextlib.__file__),
+                                               tracemalloc.Filter(False, "<frozen importlib._bootstrap*>")))
+            where = f"at {formatSize(peak.size)}" if peak.snapshot else "at the end of the part"
+            print(f"=== Day {day:02d} part {part}: peak traced memory {formatSize(peaksize)}, "
+                  f"top allocation sites {where}:", file=out)
+            for stat in snapshot.statistics("lineno")[:top]:
+                frame = stat.traceback[0]
+                print(f"{formatSize(stat.size):>10}  {stat.count:>8} blocks  {frame.filename}:{frame.lineno}", file=out)
+            print(file=out)
+
+    return hook
@@ -0,0 +1,82 @@
+import gc
+import sys
+import time
+
+# Linux only: writing 5 to clear_refs resets the peak RSS (VmHWM) of the process,
+# which is what makes a per-part peak possible without a process per part
+CLEARREFS = "/proc/self/clear_refs"
+STATUS = "/proc/self/status"
+
+
+def resetPeakRss() -> bool:
+    try:
+        with open(CLEARREFS, "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peakRss() -> int:
+    # bytes, VmHWM if available, else the peak of the whole process lifetime
+    try:
+        with open(STATUS) as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    import resource
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+class ResourceMonitor:
+    # peak RSS, memory allocated and garbage collector pauses of the enclosed code.
+    # With tracealloc the allocations are traced with tracemalloc: allocated is the peak of the traced memory
+    # above its level at the start, i.e. the most memory the code held in new allocations at any time.
+    # Tracing slows allocation heavy code down several times, so it is optional.
+    # liveblocks is a cheap extra without tracing, the change of sys.getallocatedblocks(): blocks allocated
+    # minus blocks freed, negative if the code released more than it kept.
+    def __init__(self, tracealloc: bool = False):
+        self.tracealloc = tracealloc
+        self.peakrss = None
+        self.allocated = None
+        self.liveblocks = 0
+        self.gcpause = 0.0
+        self.collections = 0
+        self._gcstart = None
+
+    def _gccallback(self, phase, info):
+        if phase == "start":
+            self._gcstart = time.perf_counter()
+        elif self._gcstart is not None:
+            self.gcpause += time.perf_counter() - self._gcstart
+            self.collections += 1
+            self._gcstart = None
+
+    def __enter__(self):
+        resetPeakRss()
+        gc.callbacks.append(self._gccallback)
+        if self.tracealloc:
+            import tracemalloc
+            self._starttracing = not tracemalloc.is_tracing()
+            if self._starttracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            self._traced, _ = tracemalloc.get_traced_memory()
+        self._liveblocks = sys.getallocatedblocks()
+        return self
+
+    def __exit__(self, *exc):
+        self.liveblocks = sys.getallocatedblocks() - self._liveblocks
+        if self.tracealloc:
+            import tracemalloc
+            _, peak = tracemalloc.get_traced_memory()
+            self.allocated = max(0, peak - self._traced)
+            if self._starttracing:
+                tracemalloc.stop()
+        gc.callbacks.remove(self._gccallback)
+        # without the reset the peak may stem from an earlier part, still an upper bound
+        self.peakrss = peakRss()
+        return False
@@ -0,0 +1,232 @@
+import contextlib
+import json
+import logging
+import os
+import sys
+import time
+
+from aoc.days import PARTS
+from aoc.resources import ResourceMonitor
+
+logger = logging.getLogger(__name__)
+
+
+class PartResult:
+    def __init__(self, day: int, part: int, status: str, result=None, wall: float = 0.0, cpu: float = 0.0, error: str = None):
+        self.day = day
+        self.part = part
+        self.status = status  # ok, skipped, noresult, error, missing
+        self.result = result
+        self.wall = wall
+        self.cpu = cpu
+        self.error = error
+        self.cached = False
+        self.peakrss = None  # bytes
+        self.allocated = None  # bytes, peak of the memory newly allocated by the part, only measured with tracealloc
+        self.liveblocks = None  # net live memory blocks: allocated minus freed during the part, may be negative
+        self.gcpause = None  # seconds spent in the garbage collector
+
+    def asdict(self):
+        return {
+            "day": self.day,
+            "part": self.part,
+            "status": self.status,
+            "result": jsonable(self.result),
+            "wall": self.wall,
+            "cpu": self.cpu,
+            "error": self.error,
+            "cached": self.cached,
+            "peakrss": self.peakrss,
+            "allocated": self.allocated,
+            "liveblocks": self.liveblocks,
+            "gcpause": self.gcpause,
+        }
+
+    def __str__(self):
+        return f"Day {self.day:02d} part {self.part}: {self.status} {self.result} ({self.wall:.3f}s)"
+
+    def __repr__(self):
+        return self.__str__()
+
+
+def jsonable(value):
+    # solvers happily return numpy scalars, those are not json serializable
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def readInput(path: str) -> list[str]:
+    if path == "-":
+        return sys.stdin.readlines()
+    with open(path) as f:
+        return f.readlines()
+
+
+class ParsedInput:
+    # the lines of one input and the models of the days with a parse hook, so both parts share one parse
+    def __init__(self, lines: list[str]):
+        self.lines = lines
+        self.models = {}
+
+    def argument(self, day):
+        if day.parse is None:
+            return self.lines
+        if day.number not in self.models:
+            self.models[day.number] = day.parse(self.lines)
+        return self.models[day.number]
+
+
+def runPart(day, part: int, lines, hooks=(), tracealloc: bool = False) -> PartResult:
+    # lines is either the raw lines, parsed on every call, or a ParsedInput which parses once.
+    # The parse counts towards the first part which needs it.
+    # hooks are context manager factories called with (day, part), e.g. the profilers in aoc.profiling.
+    # tracealloc measures the allocated memory with tracemalloc, which slows the part down
+    fun = day.parts.get(part)
+    if fun is None:
+        return PartResult(day.number, part, "missing")
+
+    monitor = ResourceMonitor(tracealloc)
+    wallstart = time.perf_counter()
+    cpustart = time.process_time()
+    try:
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(monitor)
+            for hook in hooks:
+                stack.enter_context(hook(day.number, part))
+            if isinstance(lines, ParsedInput):
+                argument = lines.argument(day)
+            else:
+                argument = day.parse(lines) if day.parse is not None else lines
+            result = fun(argument)
+        status = "ok" if result is not None else "noresult"
+        error = None
+    except NotImplementedError as e:
+        result, status, error = None, "skipped", str(e)
+    except (Exception, SystemExit) as e:
+        # some solvers bail out with exit(1) on malformed input
+        logger.exception(f"Day {day.number:02d} part {part} failed")
+        result, status, error = None, "error", f"{type(e).__name__}: {e}"
+    wall = time.perf_counter() - wallstart
+    cpu = time.process_time() - cpustart
+    partresult = PartResult(day.number, part, status, result=result, wall=wall, cpu=cpu, error=error)
+    partresult.peakrss = monitor.peakrss
+    partresult.allocated = monitor.allocated
+    partresult.liveblocks = monitor.liveblocks
+    partresult.gcpause = monitor.gcpause
+    return partresult
+
+
+def runDay(day, infile: str, parts=PARTS, hooks=(), stream: bool = False, tracealloc: bool = False) -> list[PartResult]:
+    if infile != "-" and not os.path.isfile(infile):
+        logger.warning(f"Input file {infile} does not exist")
+        return [PartResult(day.number, part, "noinput", error=f"{infile} not found") for part in parts]
+    if not stream:
+        parsed = ParsedInput(readInput(infile))
+        return [runPart(day, part, parsed, hooks, tracealloc) for part in parts]
+
+    # streaming parts get a fresh pass over the input, the others the lines read once
+    from aoc.stream import StreamedInput
+    source = StreamedInput(infile)
+    parsed = None
+    results = []
+    try:
+        for part in parts:
+            if part in day.streaming:
+                lines = source.lines()
+                results.append(runPart(day, part, lines, hooks, tracealloc))
+                lines.close()
+                # the other parts may take much longer, so report this one right away
+                logger.info("Day %02d part %d: %s", day.number, part, results[-1].result)
+            else:
+                if parsed is None:
+                    parsed = ParsedInput(list(source.lines()))
+                results.append(runPart(day, part, parsed, hooks, tracealloc))
+    finally:
+        source.close()
+    return results
+
+
+def formatSize(size: int) -> str:
+    if size is None:
+        return ""
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def formatTable(results: list[PartResult], elapsed: float = None) -> str:
+    header = ("Day", "Part", "Status", "Wall [s]", "CPU [s]", "GC [s]", "Peak RSS", "Allocated", "Net live blocks",
+              "Result")
+    rows = [(f"{r.day:02d}", str(r.part), r.status + (" (cached)" if r.cached else ""), f"{r.wall:.4f}", f"{r.cpu:.4f}",
+             f"{r.gcpause:.4f}" if r.gcpause is not None else "", formatSize(r.peakrss), formatSize(r.allocated),
+             f"{r.liveblocks:+d}" if r.liveblocks is not None else "",
+             str(r.result) if r.result is not None else (r.error or "")) for r in results]
+    rows.append(("all", "", "", f"{sum(r.wall for r in results):.4f}", f"{sum(r.cpu for r in results):.4f}",
+                 f"{sum(r.gcpause or 0.0 for r in results):.4f}", formatSize(max((r.peakrss or 0 for r in results), default=0)),
+                 "", "", ""))
+    widths = [max(len(row[i]) for row in [header] + rows) for i in range(len(header))]
+    lines = ["  ".join(val.ljust(width) for val, width in zip(row, widths)).rstrip() for row in [header] + rows]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    lines.insert(len(lines) - 1, lines[1])
+    if elapsed is not None:
+        lines.append(f"Elapsed: {elapsed:.4f}s")
+    return "\n".join(lines)
+
+
+def toJson(results: list[PartResult]) -> str:
+    return json.dumps([r.asdict() for r in results], indent=2)
+
+
+# rough single-core runtimes in seconds on the real inputs, used to start the long jobs first
+EXPECTEDRUNTIME = {
+    (12, 2): 2.0,
+    (16, 2): 8.0,
+    (22, 1): 6.0,
+    (22, 2): 6.0,
+    (23, 1): 2.0,
+    (23, 2): 30.0,
+    (17, 2): 3.0,
+    (17, 1): 2.0,
+    (21, 2): 2.0,
+    (24, 2): 1.0,
+    (25, 1): 1.0,
+}
+
+
+def scheduleJobs(jobs):
+    # longest-processing-time first, ties in day/part order
+    return sorted(jobs, key=lambda job: (-EXPECTEDRUNTIME.get((job[0], job[1]), 0.0), job[0], job[1]))
+
+
+# per worker process, keeps the parsed input around in case the same worker also gets the other part
+_parsedinputs = {}
+
+
+def runJob(daynumber: int, part: int, infile: str, stream: bool = False, tracealloc: bool = False) -> PartResult:
+    # entry point for worker processes, the day module is loaded once per worker
+    from aoc.days import Day
+    day = Day(daynumber)
+    if not os.path.isfile(infile):
+        return PartResult(daynumber, part, "noinput", error=f"{infile} not found")
+    if stream and part in day.streaming:
+        return runDay(day, infile, parts=(part,), stream=True, tracealloc=tracealloc)[0]
+    stat = os.stat(infile)
+    key = (daynumber, os.path.abspath(infile), stat.st_mtime_ns, stat.st_size)
+    if key not in _parsedinputs:
+        if len(_parsedinputs) >= 4:
+            del _parsedinputs[next(iter(_parsedinputs))]
+        _parsedinputs[key] = ParsedInput(readInput(infile))
+    return runPart(day, part, _parsedinputs[key], tracealloc=tracealloc)
+
+
+def runParallel(jobs, numworkers: int, stream: bool = False, tracealloc: bool = False) -> list[PartResult]:
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=numworkers) as executor:
+        futures = [executor.submit(runJob, *job, stream=stream, tracealloc=tracealloc) for job in scheduleJobs(jobs)]
+        results = [future.result() for future in futures]
+    return sorted(results, key=lambda r: (r.day, r.part))
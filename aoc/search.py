@@ -0,0 +1,138 @@
+from array import array
+
+# States are plain ints, usually a flat grid index y * width + x with further components packed on top,
+# e.g. (index * 4 + direction) * (maxcount + 1) + count. The buffers below are indexed by state.
+
+UNSEEN = -1
+DY = (-1, 0, 1, 0)  # up, right, down, left
+DX = (0, 1, 0, -1)
+
+
+def encode(y: int, x: int, width: int) -> int:
+    return y * width + x
+
+
+def decode(index: int, width: int) -> tuple[int, int]:
+    return divmod(index, width)
+
+
+def visitedBuffer(numstates: int) -> bytearray:
+    return bytearray(numstates)
+
+
+def distanceBuffer(numstates: int) -> array:
+    return array("q", [UNSEEN]) * numstates
+
+
+def bfsLayers(starts, neighbors, visited: bytearray, maxdepth: int = None):
+    # yields (depth, frontier) for depth 0, 1, ..., every state appears in exactly one frontier.
+    # neighbors(state) yields the successor states, visited is updated as states are discovered.
+    frontier = []
+    for state in starts:
+        if not visited[state]:
+            visited[state] = 1
+            frontier.append(state)
+    depth = 0
+    while frontier:
+        yield depth, frontier
+        if depth == maxdepth:
+            return
+        depth += 1
+        nextfrontier = []
+        for state in frontier:
+            for neighbor in neighbors(state):
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    nextfrontier.append(neighbor)
+        frontier = nextfrontier
+
+
+def bfs(starts, neighbors, numstates: int, maxdepth: int = None) -> array:
+    # unweighted distances from the nearest start, UNSEEN for unreachable states
+    dist = distanceBuffer(numstates)
+    for depth, frontier in bfsLayers(starts, neighbors, visitedBuffer(numstates), maxdepth):
+        for state in frontier:
+            dist[state] = depth
+    return dist
+
+
+class BucketQueue:
+    # Dial's monotone priority queue for integer weights in [0, maxweight]: a ring of maxweight + 1 buckets,
+    # pushes must not be smaller than the last popped priority
+    def __init__(self, maxweight: int):
+        self.buckets = [[] for _ in range(maxweight + 1)]
+        self.current = 0
+        self.size = 0
+
+    def push(self, priority: int, state: int):
+        assert self.current <= priority <= self.current + len(self.buckets) - 1
+        self.buckets[priority % len(self.buckets)].append(state)
+        self.size += 1
+
+    def pop(self) -> tuple[int, int]:
+        if self.size == 0:
+            raise IndexError("pop from an empty BucketQueue")
+        bucket = self.buckets[self.current % len(self.buckets)]
+        while not bucket:
+            self.current += 1
+            bucket = self.buckets[self.current % len(self.buckets)]
+        self.size -= 1
+        return self.current, bucket.pop()
+
+    def __len__(self):
+        return self.size
+
+    def __str__(self):
+        return f"BucketQueue with {self.size} states at priority {self.current}"
+
+    def __repr__(self):
+        return self.__str__()
+
+
+def dijkstra(starts, neighbors, numstates: int, maxweight: int, isgoal):
+    # neighbors(state) yields (successor, weight) with integer weights in [0, maxweight].
+    # Returns (cost, state) of the first goal state settled, (None, None) if no goal is reachable.
+    dist = distanceBuffer(numstates)
+    queue = BucketQueue(maxweight)
+    for state in starts:
+        dist[state] = 0
+        queue.push(0, state)
+    while queue:
+        cost, state = queue.pop()
+        if cost > dist[state]:
+            # stale entry, the state was pushed again with a lower cost
+            continue
+        if isgoal(state):
+            return cost, state
+        for neighbor, weight in neighbors(state):
+            newcost = cost + weight
+            if dist[neighbor] == UNSEEN or newcost < dist[neighbor]:
+                dist[neighbor] = newcost
+                queue.push(newcost, neighbor)
+    return None, None
+
+
+def longestPath(start: int, goal: int, neighbors, numstates: int) -> int:
+    # exhaustive DFS over all simple paths, neighbors(state) yields (successor, weight).
+    # Exponential in general, fine for graphs with few branches. None if the goal is unreachable.
+    visited = visitedBuffer(numstates)
+    longest = None
+    # entries are (state, length), backtracking entries carry the complement ~state
+    stack = [(start, 0)]
+    while stack:
+        state, length = stack.pop()
+        if state < 0:
+            visited[~state] = 0
+            continue
+        if visited[state]:
+            continue
+        if state == goal:
+            if longest is None or length > longest:
+                longest = length
+            continue
+        visited[state] = 1
+        stack.append((~state, length))
+        for neighbor, weight in neighbors(state):
+            if not visited[neighbor]:
+                stack.append((neighbor, length + weight))
+    return longest
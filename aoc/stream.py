@@ -0,0 +1,54 @@
+import sys
+import tempfile
+
+DEFAULTBUFFER = 1 << 20
+
+
+def readLines(path: str, buffering: int = DEFAULTBUFFER):
+    # lazily yields the lines of a file ('-' for stdin), memory is bounded by the buffer
+    if path == "-":
+        yield from sys.stdin
+        return
+    with open(path, buffering=buffering) as f:
+        yield from f
+
+
+class StreamedInput:
+    # an input which can be streamed several times, once per part.
+    # Files are simply reopened, stdin is spooled to a temporary file during the first pass.
+    def __init__(self, path: str, buffering: int = DEFAULTBUFFER):
+        self.path = path
+        self.buffering = buffering
+        self.spool = None
+        self.drained = False
+
+    def lines(self):
+        if self.path != "-":
+            return readLines(self.path, self.buffering)
+        if self.spool is None:
+            self.spool = tempfile.TemporaryFile("w+", buffering=self.buffering)
+            return self._teeStdin()
+        if not self.drained:
+            self._drain()
+        self.spool.seek(0)
+        # a generator, closing it must not close the spool
+        return (line for line in self.spool)
+
+    def _teeStdin(self):
+        try:
+            for line in sys.stdin:
+                self.spool.write(line)
+                yield line
+        finally:
+            # a part may stop early, e.g. day24 part2 only needs three stones
+            self._drain()
+
+    def _drain(self):
+        for line in sys.stdin:
+            self.spool.write(line)
+        self.spool.flush()
+        self.drained = True
+
+    def close(self):
+        if self.spool is not None:
+            self.spool.close()
@@ -1,54 +1,149 @@
 import logging
-import re
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-strToIntMap = {word: num for (num, word) in enumerate("one two three four five six seven eight nine".split(), start=1)}
-
-
-def convertToInt(match: str) -> int:
-    assert len(match) > 0
-    if len(match) == 1 and match.isdigit():
-        return int(match)
-    else:
-        assert match in strToIntMap, f"{match} not in {strToIntMap}"
-        return strToIntMap[match]
-
-
-def part1(lines):
-    # the program needs to read a multi-line input from stdin
-    # we do not know the number of input lines in advance
-    # so we read the input line by line until EOF
-
-    values = []
-    for line in lines:
-        # each line contains a string of various characters and digits
-        # get the first and last digit of each line
-        digits = [int(d) for d in line if d.isdigit()]
-        values.append(digits[0] * 10 + digits[-1])
-
-    return sum(values)
-
+STREAMING = (1, 2)
+CHUNKED = (1, 2)
 
-def part2(lines):
-    values = []
-    matchRegex = r"(?=(one|two|three|four|five|six|seven|eight|nine|[0-9]))"
-    matchRegex = re.compile(matchRegex)
+strToIntMap = {word: num for (num, word) in enumerate("one two three four five six seven eight nine".split(), start=1)}
+DIGITWORDS = {**strToIntMap, **{str(d): d for d in range(10)}}
+
+
+def buildAutomaton(patterns):
+    # Aho-Corasick automaton over bytes as a complete transition table, state 0 is the root.
+    # output[state] is (length, value) of the longest pattern ending in that state, or None.
+    delta = [[0] * 256]
+    output = [None]
+    for pattern, value in patterns:
+        state = 0
+        for byte in pattern:
+            if delta[state][byte] == 0:
+                delta.append([0] * 256)
+                output.append(None)
+                delta[state][byte] = len(delta) - 1
+            state = delta[state][byte]
+        output[state] = (len(pattern), value)
+
+    # breadth first, so the failure state of every state is complete before it is used
+    fail = [0] * len(delta)
+    queue = [child for child in delta[0] if child != 0]
+    while queue:
+        nextqueue = []
+        for state in queue:
+            # a pattern ending here is longer than any ending in the failure state, a proper suffix
+            output[state] = output[state] or output[fail[state]]
+            for byte in range(256):
+                child = delta[state][byte]
+                if child != 0:
+                    fail[child] = delta[fail[state]][byte]
+                    nextqueue.append(child)
+                else:
+                    delta[state][byte] = delta[fail[state]][byte]
+        queue = nextqueue
+    return delta, output
+
+
+class WordScanner:
+    # finds the first and the last occurrence of any word of a word -> value table in a line,
+    # scanning forward from the start and backward from the end, so only the bytes up to the matches are read.
+    # Matches may overlap ("twone" has two and one), of matches starting at the same byte the longest wins.
+    def __init__(self, words: dict = DIGITWORDS):
+        assert words and all(words), "words must be non-empty"
+        patterns = [(word.encode(), value) for word, value in words.items()]
+        self.maxlen = max(len(pattern) for pattern, _ in patterns)
+        self.forward = buildAutomaton(patterns)
+        self.backward = buildAutomaton([(pattern[::-1], value) for pattern, value in patterns])
+
+    def first(self, line: bytes):
+        # the automaton reports the match which ends first, one starting earlier may still end
+        # up to maxlen - 1 bytes after its start, so the scan continues that far
+        delta, output = self.forward
+        state = 0
+        beststart, bestlength, bestvalue = None, 0, None
+        end = len(line)
+        i = 0
+        while i < end:
+            state = delta[state][line[i]]
+            match = output[state]
+            if match is not None:
+                length, value = match
+                start = i - length + 1
+                if beststart is None or start < beststart or (start == beststart and length > bestlength):
+                    beststart, bestlength, bestvalue = start, length, value
+                    end = min(end, beststart + self.maxlen)
+            i += 1
+        return bestvalue
+
+    def last(self, line: bytes):
+        # scanning backward the first reported match is the one which starts last
+        delta, output = self.backward
+        state = 0
+        for i in range(len(line) - 1, -1, -1):
+            state = delta[state][line[i]]
+            if output[state] is not None:
+                return output[state][1]
+        return None
+
+    def __str__(self):
+        return f"WordScanner with {len(self.forward[0])} states for words up to {self.maxlen} bytes"
+
+    def __repr__(self):
+        return self.__str__()
+
+
+def calibrationSum(buffer, firstline: int = 1) -> int:
+    # part1 over a buffer of whole lines without per-character python work: the digits are found with a mask,
+    # their lines by bisecting the newline offsets, and the first/last digit of a line bound its run of digits
+    import numpy as np
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    if len(data) == 0:
+        return 0
+    ends = np.flatnonzero(data == ord("\n"))
+    if len(ends) == 0 or ends[-1] != len(data) - 1:
+        ends = np.append(ends, len(data))
+    digitpos = np.flatnonzero((data >= ord("0")) & (data <= ord("9")))
+    digitline = np.searchsorted(ends, digitpos)
+    lines = np.arange(len(ends))
+    first = np.searchsorted(digitline, lines, side="left")
+    last = np.searchsorted(digitline, lines, side="right") - 1
+    if np.any(first > last):
+        raise IndexError(f"Line {firstline + int(np.argmax(first > last))} does not contain a digit")
+    values = (data[digitpos[first]] - ord("0")).astype(np.int64) * 10 + (data[digitpos[last]] - ord("0"))
+    return int(values.sum())
+
+
+def part1(lines, batchsize: int = 1 << 16):
+    # vectorized over batches of lines, so streamed input stays in constant memory
+    from itertools import islice
+    lines = iter(lines)
+    total = 0
+    numlines = 0
+    while batch := list(islice(lines, batchsize)):
+        total += calibrationSum("".join(batch).encode(), firstline=numlines + 1)
+        numlines += len(batch)
+    return total
+
+
+def part2(lines, words: dict = DIGITWORDS):
+    total = 0
+    scanner = WordScanner(words)
+    tracing = logger.isEnabledFor(logging.DEBUG)
 
     for line in lines:
-        matches = matchRegex.finditer(line)
-        results = [match.group(1) for match in matches]
-        assert len(results) > 0
-        matches = [results[0], results[-1]]
-        convertedmatches = list(map(convertToInt, [matches[0], matches[-1]]))
+        if isinstance(line, str):
+            line = line.encode()
+        first = scanner.first(line)
+        last = scanner.last(line)
+        assert first is not None
 
-        values.append(convertedmatches[0] * 10 + convertedmatches[-1])
-        logger.debug(f"{line.strip()} ===> {results} ===> {convertedmatches}")
-    return sum(values)
+        total += first * 10 + last
+        if __debug__ and tracing:
+            logger.debug("%s ===> %s %s", line.strip(), first, last)
+    return total
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     import sys
     import os
     infile = sys.argv[1] if len(sys.argv) > 1 else 'input.txt'
@@ -56,15 +151,15 @@ def main():
         logger.error(f"Input file {infile} does not exist")
         return
 
-    with open(infile) as f:
-        lines = f.readlines()
-
     for i, fun in enumerate((part1, part2), start=1):
-        try:
-            result = fun(lines)
-        except NotImplementedError as e:
-            logger.debug(e)
-            continue
+        with open(infile) as f:
+            # the parts in STREAMING read the file lazily, line by line
+            lines = f if i in STREAMING else f.readlines()
+            try:
+                result = fun(lines)
+            except NotImplementedError as e:
+                logger.debug(e)
+                continue
         if result is None:
             logger.error(f"Part {i} does not return a result")
             continue
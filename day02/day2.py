@@ -0,0 +1,113 @@
+import logging
+from array import array
+
+logger = logging.getLogger(__name__)
+
+STREAMING = (1, 2)
+CHUNKED = (1, 2)
+
+COLORS = ("red", "green", "blue")
+BAG = (12, 13, 14)
+
+
+class Games:
+    # all draws of all games as columns: game id, draw index within the game, and the red/green/blue counts.
+    # The rows of a game are consecutive and start with draw index 0.
+    def __init__(self, lines):
+        import numpy as np
+        columns = {name: array("q") for name in ("game", "draw", "red", "green", "blue")}
+        for line in lines:
+            header, _, draws = line.partition(":")
+            if not draws:
+                continue
+            gameid = int(header.split()[1])
+            for drawindex, draw in enumerate(draws.split(";")):
+                counts = dict.fromkeys(COLORS, 0)
+                for cubes in draw.split(","):
+                    count, color = cubes.split()
+                    counts[color] += int(count)
+                columns["game"].append(gameid)
+                columns["draw"].append(drawindex)
+                for color in COLORS:
+                    columns[color].append(counts[color])
+        self.game = np.asarray(columns["game"], dtype=np.int64)
+        self.draw = np.asarray(columns["draw"], dtype=np.int64)
+        self.rgb = np.stack([np.asarray(columns[color], dtype=np.int64) for color in COLORS], axis=1)
+        starts = np.flatnonzero(self.draw == 0)
+        self.ids = self.game[starts]
+        # the fewest cubes of each colour a game needs, one row per game
+        self.minimum = np.maximum.reduceat(self.rgb, starts, axis=0) if len(starts) > 0 else self.rgb
+
+    def possible(self, bags):
+        # (number of bags, number of games) booleans, whether a game is possible with a bag of (r, g, b) cubes
+        import numpy as np
+        bags = np.asarray(bags, dtype=np.int64).reshape(-1, 3)
+        return np.all(self.minimum[np.newaxis, :, :] <= bags[:, np.newaxis, :], axis=2)
+
+    def powers(self):
+        return self.minimum.prod(axis=1)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __str__(self):
+        return f"{len(self.ids)} games with {len(self.game)} draws"
+
+    def __repr__(self):
+        return self.__str__()
+
+
+def batches(lines, batchsize: int):
+    # Games of consecutive batches of lines, so streamed input stays in constant memory
+    from itertools import islice
+    lines = iter(lines)
+    while batch := list(islice(lines, batchsize)):
+        yield Games(batch)
+
+
+def parse(lines, batchsize: int = 1 << 16):
+    # a list of lines is parsed once into one store shared by both parts,
+    # streamed lines are passed on and parsed batch by batch in each part
+    if isinstance(lines, list):
+        return Games(lines)
+    return batches(lines, batchsize)
+
+
+def part1(games):
+    if isinstance(games, Games):
+        return int(games.ids[games.possible(BAG)[0]].sum())
+    return sum(part1(batch) for batch in games)
+
+
+def part2(games):
+    if isinstance(games, Games):
+        return int(games.powers().sum())
+    return sum(part2(batch) for batch in games)
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    import sys
+    import os
+    infile = sys.argv[1] if len(sys.argv) > 1 else 'input.txt'
+    if not os.path.isfile(infile):
+        logger.error(f"Input file {infile} does not exist")
+        return
+
+    with open(infile) as f:
+        data = parse(f.readlines())
+
+    for i, fun in enumerate((part1, part2), start=1):
+        try:
+            result = fun(data)
+        except NotImplementedError as e:
+            logger.debug(e)
+            continue
+        if result is None:
+            logger.error(f"Part {i} does not return a result")
+            continue
+        logger.info(f"Part {i}: {result}")
+
+
+if __name__ == '__main__':
+    main()
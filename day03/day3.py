@@ -1,127 +1,177 @@
 import logging
+import os
+import re
 import sys
-from enum import Enum
+from bisect import bisect_right
+from collections import deque
 
+if __name__ == "__main__":
+    # run as a script: the shared aoc package is one directory up
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-
-class FieldType(Enum):
-    DIGIT = 1
-    SYMBOL = 2
-    NONE = 3
-
-    @staticmethod
-    def get(char: str):
-        assert len(char) == 1
-        if char.isdigit():
-            return FieldType.DIGIT
-        elif char == ".":
-            return FieldType.NONE
-        else:
-            return FieldType.SYMBOL
+# streamed input is evaluated in a three row window instead of as a numpy grid
+STREAMING = (1, 2)
+NUMBERREGEX = re.compile(r"\d+")
+SYMBOLREGEX = re.compile(r"[^\d.]")
 
 
-class Grid:
+class Schematic:
+    # numpy view of the grid: digit runs (numbers) are labelled 1..n in reading order, 0 is no number
     def __init__(self, lines):
-        self.lines = [line.strip() for line in lines]
-        self.width = len(self.lines[0])
-        self.height = len(self.lines)
-        assert all((len(line) == self.width for line in self.lines))
-
-    def get(self, x, y) -> str:
-        assert x < self.width, f"x {x}/{self.width} out of range"
-        assert y < self.height, f"y {y}/{self.height} out of range"
-        return self.lines[y][x]
-
-    def adjascentFields(self, line, startColumn, endColumn):
-        # start and endcolumn are inclusive
-        for y in range(max(0, line - 1), min(self.height, line + 1 + 1)):
-            for x in range(max(0, startColumn - 1), min(self.width, endColumn + 1 + 1)):
-                if y != line or x < startColumn or x > endColumn:
-                    logger.debug(f"Yield {y}, {x}: {self.get(x, y)}")
-                    yield self.get(x, y)
-
-    def getGears(self):
-        GEARSYMBOL = "*"
-        class GearPart:
-            def __init__(self, line, startColumn, endColumn, value):
-                self.line = line
-                self.startColumn = startColumn
-                self.endColumn = endColumn
-                self.value = int(value)
-
-            def __str__(self):
-                return f"({self.line}, {self.startColumn}): {self.value}"
-
-            def __repr__(self):
-                return str(self)
-
-        gearparts = []
-
-        partLookup = [[None]*self.width for _ in range(self.height)]
-        import re
-        for i, line in enumerate(self.lines):
-            for match in re.finditer(r"\d+", line):
-                gear = GearPart(line=i, startColumn=match.start(), endColumn=match.end(), value=int(match.string[match.start():match.end()]))
-                gearparts.append(gear)
-                for x in range(match.start(), match.end()):
-                    partLookup[i][x] = gear
-
-        logger.info(f"Found {len(gearparts)} gear parts")
-        result = 0
-        from functools import reduce
-        for i, line in enumerate(self.lines):
-            for charpos, c in enumerate(line):
-                if c == GEARSYMBOL:
-                    # needs to be adjascent to exactly two numbers
-                    nums = set()
-                    for x, y in self.adjascentFields(i, charpos, charpos):
-                        part = partLookup[y][x]
-                        if part is not None:
-                            nums.add(part)
-                    if len(nums) == 2:
-                        # gear found
-                        logger.debug(f"Found gear at (y, x) {(i, charpos)}")
-                        result += reduce(lambda a, b: a*b.value, nums, 1)
-
-        return result
-
-
-
-
-    def adjascentFields(self, line, startColumn, endColumn):
-        # start and endcolumn are inclusive
-        for y in range(max(0, line - 1), min(self.height, line + 1 + 1)):
-            for x in range(max(0, startColumn - 1), min(self.width, endColumn + 1 + 1)):
-                if y != line or x < startColumn or x > endColumn:
-                    logger.debug(f"Yield {y}, {x}: {self.get(x, y)}")
-                    yield (x, y)
-
-    def getEngineParts(self):
-        import re
-
-        engineparts = []
-        for i, line in enumerate(self.lines):
-            for match in re.finditer(r"\d+", line):
-                startpos, endpos = match.start(), match.end()
-                logger.debug(f"Testing {match}")
-                if any((FieldType.get(self.get(x, y)) == FieldType.SYMBOL for x, y in self.adjascentFields(i, startpos, endpos - 1))):
-                    engineparts.append(int(match.string[match.start():match.end()]))
-
-        return engineparts
+        # numpy is only needed here, so it is not imported with the module
+        import numpy as np
+        from aoc.grid import gridFromLines
+        self.cells = gridFromLines(lines)
+        self.height, self.width = self.cells.shape
+        isdigit = (self.cells >= ord("0")) & (self.cells <= ord("9"))
+        self.symbols = ~isdigit & (self.cells != ord("."))
+
+        # a run starts at a digit without a digit to its left, runs never wrap as every row starts one
+        runstart = isdigit.copy()
+        runstart[:, 1:] &= ~isdigit[:, :-1]
+        self.labels = np.where(isdigit, np.cumsum(runstart.ravel(), dtype=np.int32).reshape(self.cells.shape), 0)
+        self.numruns = int(runstart.sum())
+
+        # the digits in reading order, so the digits of a run are consecutive
+        self.digitpos = np.flatnonzero(isdigit.ravel())
+        digitlabels = self.labels.ravel()[self.digitpos]
+        self.runfirst = np.flatnonzero(np.diff(digitlabels, prepend=0))
+        runlast = np.append(self.runfirst[1:], len(self.digitpos)) - 1
+        exponents = runlast[digitlabels - 1] - np.arange(len(self.digitpos))
+        digits = (self.cells.ravel()[self.digitpos] - ord("0")).astype(np.int64)
+        # values[label] is the number of a run, values[0] = 0
+        self.values = np.zeros(self.numruns + 1, dtype=np.int64)
+        if self.numruns > 0:
+            self.values[1:] = np.add.reduceat(digits * np.power(10, exponents, dtype=np.int64), self.runfirst)
+
+    def dilate(self, mask):
+        # cells with a set cell in their 3x3 neighbourhood
+        import numpy as np
+        padded = np.zeros((self.height + 2, self.width + 2), dtype=bool)
+        padded[1:-1, 1:-1] = mask
+        dilated = np.zeros(mask.shape, dtype=bool)
+        for dy in range(3):
+            for dx in range(3):
+                dilated |= padded[dy:dy + self.height, dx:dx + self.width]
+        return dilated
+
+    def partNumberSum(self) -> int:
+        if self.numruns == 0:
+            return 0
+        import numpy as np
+        # a number is a part if any of its digits touches a symbol
+        nearsymbol = self.dilate(self.symbols).ravel()[self.digitpos]
+        isPart = np.logical_or.reduceat(nearsymbol, self.runfirst)
+        return int(self.values[1:][isPart].sum())
+
+    def gearRatioSum(self) -> int:
+        # all stars at once: gather the labels of their 8 neighbours, a gear has exactly two distinct ones
+        import numpy as np
+        stars = np.flatnonzero(self.cells.ravel() == ord("*"))
+        if len(stars) == 0:
+            return 0
+        padded = np.zeros((self.height + 2, self.width + 2), dtype=np.int32)
+        padded[1:-1, 1:-1] = self.labels
+        ys, xs = np.divmod(stars, self.width)
+        neighbours = np.stack([padded[ys + 1 + dy, xs + 1 + dx]
+                               for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx], axis=1)
+        # sorted per star, a label is new if it differs from its left neighbour, zeros are no number
+        neighbours.sort(axis=1)
+        distinct = (neighbours != 0) & np.concatenate(
+            [np.ones((len(stars), 1), dtype=bool), neighbours[:, 1:] != neighbours[:, :-1]], axis=1)
+        gears = distinct.sum(axis=1) == 2
+        # of two distinct labels the larger one is last, the smaller one the smallest nonzero
+        larger = neighbours[gears, -1]
+        smaller = np.where(neighbours[gears] == 0, np.iinfo(np.int32).max, neighbours[gears]).min(axis=1)
+        logger.info("Found %d gears among %d stars", int(gears.sum()), len(stars))
+        return int((self.values[larger] * self.values[smaller]).sum())
+
+    def __str__(self):
+        return f"Schematic {self.height}x{self.width} with {self.numruns} numbers"
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class Row:
+    # one row of a schematic with its numbers as (start, end, value), end exclusive
+    def __init__(self, line: str = ""):
+        self.line = line
+        self.numbers = [(match.start(), match.end(), int(match.group())) for match in NUMBERREGEX.finditer(line)]
+        self.starts = [start for start, _, _ in self.numbers]
+
+    def hasSymbol(self, start: int, end: int) -> bool:
+        return SYMBOLREGEX.search(self.line, max(0, start), max(0, end)) is not None
+
+    def numbersAround(self, x: int):
+        # numbers touching columns x - 1 to x + 1, as numbers do not overlap there are at most three
+        idx = bisect_right(self.starts, x + 1)
+        for start, end, value in self.numbers[max(0, idx - 3):idx]:
+            if end >= x:
+                yield value
+
+
+def windowTotals(lines, gears: bool = True):
+    # Streaming evaluation keeping three rows: a row is resolved once the row below it has been read,
+    # as its numbers and stars only touch the rows directly above and below.
+    # Yields the running (part number sum, gear ratio sum) after every row.
+    window = deque([Row()], maxlen=3)
+    partsum = 0
+    gearsum = 0
+
+    def resolve(above, row, below):
+        nonlocal partsum, gearsum
+        for start, end, value in row.numbers:
+            if any(r.hasSymbol(start - 1, end + 1) for r in (above, row, below)):
+                partsum += value
+        if not gears:
+            return
+        x = row.line.find("*")
+        while x >= 0:
+            values = [value for r in (above, row, below) for value in r.numbersAround(x)]
+            if len(values) == 2:
+                gearsum += values[0] * values[1]
+            x = row.line.find("*", x + 1)
+
+    for line in lines:
+        window.append(Row(line.strip()))
+        if len(window) == 3:
+            resolve(*window)
+            yield partsum, gearsum
+    # the last row has nothing below it
+    if len(window) >= 2:
+        window.append(Row())
+        resolve(*window)
+        yield partsum, gearsum
+
+
+def part1(lines):
+    if isinstance(lines, list):
+        return Schematic(lines).partNumberSum()
+    partsum = 0
+    for partsum, _ in windowTotals(lines, gears=False):
+        pass
+    return partsum
+
+
+def part2(lines):
+    if isinstance(lines, list):
+        return Schematic(lines).gearRatioSum()
+    gearsum = 0
+    for _, gearsum in windowTotals(lines):
+        pass
+    return gearsum
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     infile = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
     with open(infile, 'r') as f:
         lines = f.readlines()
-    grid = Grid(lines)
-    engineparts = grid.getEngineParts()
-    print(f"Part 1 {sum(engineparts)}")
-    part2 = grid.getGears()
-    print(f"Part 2 {part2}")
+    print(f"Part 1 {part1(lines)}")
+    print(f"Part 2 {part2(lines)}")
 
 
 if __name__ == "__main__":
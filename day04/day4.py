@@ -1,10 +1,18 @@
 import logging
-import sys
 import re
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+STREAMING = (1,)
+CHUNKED = (1,)
+
+
+def bitmask(numbers: str) -> int:
+    mask = 0
+    for x in numbers.split():
+        mask |= 1 << int(x)
+    return mask
+
 
 class Card:
     def __init__(self, line):
@@ -13,47 +21,117 @@ class Card:
             logger.error(f"{line}")
             exit(1)
         self.id = int(match.group('cardid'))
-        self.winning = set((int(x) for x in re.findall(r"\d+", match.group('winning'))))
-        self.have = set((int(x) for x in re.findall(r"\d+", match.group('have'))))
+        # bit x is set if number x is on the card
+        self.winning = bitmask(match.group('winning'))
+        self.have = bitmask(match.group('have'))
         self.copies = 1
 
     def winningNumbers(self):
-        return len(self.winning.intersection(self.have))
+        return (self.winning & self.have).bit_count()
 
     def value(self):
         havewinning = self.winningNumbers()
         return 2**(havewinning - 1) if havewinning > 0 else 0
 
     def __str__(self):
-        return f"Card {self.id}: Winning Numbers: {self.winning} | Have: {self.have}"
+        def numbers(mask):
+            return {x for x in range(mask.bit_length()) if mask >> x & 1}
+        return f"Card {self.id}: Winning Numbers: {numbers(self.winning)} | Have: {numbers(self.have)}"
 
 
 def part1(lines):
-    totalvalue = 0
-    for line in lines:
-        card = Card(line)
-        logger.debug(card)
-        totalvalue += card.value()
-    logger.info(f"Part 1: {totalvalue}")
+    return sum(Card(line).value() for line in lines)
 
 
 def part2(lines):
     cards = [Card(line) for line in lines]
-    for card in cards:
-        correct = card.winningNumbers()
-        for c in cards[card.id:card.id + correct]:
-            c.copies += card.copies
+    correct = [card.winningNumbers() for card in cards]
+    # copies won by card i go to the next correct[i] cards, as a running difference array
+    pending = [0] * (len(cards) + 1)
+    running = 0
+    for i, card in enumerate(cards):
+        running += pending[i]
+        card.copies += running
+        pending[i + 1] += card.copies
+        pending[min(len(cards), i + 1 + correct[i])] -= card.copies
 
     numcards = sum((c.copies for c in cards))
-    logger.info(f"Part 2: {numcards}")
+    return numcards
+
+
+class ScratchcardLedger:
+    # Scores cards as they arrive. The copies won for upcoming cards are kept as a difference array in a ring
+    # buffer which only spans the largest win count seen, so appending a card is O(1) amortized.
+    # Copies won past the last appended card are counted once that card arrives.
+    def __init__(self):
+        self.score = 0  # part1 so far
+        self.count = 0  # part2 so far, total number of cards including copies
+        self.numcards = 0
+        self._diffs = [0] * 16  # _diffs[(_head + k) % len] is the change of the running copies k cards ahead
+        self._head = 0
+        self._running = 0
+
+    def _grow(self, size: int):
+        capacity = len(self._diffs)
+        self._diffs = [self._diffs[(self._head + k) % capacity] for k in range(capacity)] + [0] * (size - capacity)
+        self._head = 0
+
+    def append(self, card: Card) -> Card:
+        diffs = self._diffs
+        self._running += diffs[self._head]
+        diffs[self._head] = 0
+        self._head = (self._head + 1) % len(diffs)
+        card.copies = 1 + self._running
+
+        havewinning = card.winningNumbers()
+        self.score += card.value()
+        self.count += card.copies
+        self.numcards += 1
+        if havewinning > 0:
+            if havewinning >= len(diffs):
+                self._grow(2 * (havewinning + 1))
+                diffs = self._diffs
+            # every copy of this card wins one copy of each of the next havewinning cards
+            diffs[self._head] += card.copies
+            diffs[(self._head + havewinning) % len(diffs)] -= card.copies
+        return card
+
+    def extend(self, cards):
+        for card in cards:
+            self.append(card)
+
+    def __len__(self):
+        return self.numcards
+
+    def __str__(self):
+        return f"{self.numcards} scratchcards: score {self.score}, {self.count} cards with copies"
+
+    def __repr__(self):
+        return self.__str__()
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    import sys
+    import os
     infile = sys.argv[1] if len(sys.argv) > 1 else 'input.txt'
-    with open(infile) as f:
-        lines = f.readlines()
-    part1(lines)
-    part2(lines)
+    if not os.path.isfile(infile):
+        logger.error(f"Input file {infile} does not exist")
+        return
+
+    for i, fun in enumerate((part1, part2), start=1):
+        with open(infile) as f:
+            # the parts in STREAMING read the file lazily, line by line
+            lines = f if i in STREAMING else f.readlines()
+            try:
+                result = fun(lines)
+            except NotImplementedError as e:
+                logger.debug(e)
+                continue
+        if result is None:
+            logger.error(f"Part {i} does not return a result")
+            continue
+        logger.info(f"Part {i}: {result}")
 
 
 if __name__ == '__main__':
@@ -1,9 +1,16 @@
 import logging
-import sys
+import os
 import re
+import sys
+from bisect import bisect_right
 from collections import defaultdict
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+if __name__ == "__main__":
+    # run as a script: the shared aoc package is one directory up
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.intervals import IntervalSet  # noqa: E402
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,17 +43,6 @@ class SeedRange:
             return None
         return self.source + (dest - self.dest)
 
-    def intersect(self, sourcestart, sourceend):
-        assert sourcestart <= sourceend
-        return (sourcestart <= self.sourceend and sourceend >= self.source) or (sourcestart >= self.source and sourcestart <= self.sourceend)
-
-    def maprange(self, sourcestart, sourceend):
-        if not self.intersect(sourcestart, sourceend):
-            return None
-        sourcestart = max(sourcestart, self.source)
-        sourceend = min(sourceend, self.sourceend)
-        return (self.map_forward(sourcestart), self.map_forward(sourceend))
-
 
 
 class ThingToThingMap:
@@ -68,42 +64,26 @@ class ThingToThingMap:
             self.ranges.append(SeedRange(match.group('source'), match.group('dest'), match.group('rangelen')))
 
         self.ranges = list(sorted(self.ranges, key=lambda r: r.source))
+        self.sources = [r.source for r in self.ranges]
+        # every piece of an interval set cut at these lies either within a single range or outside of all
+        self.breakpoints = sorted({r.source for r in self.ranges} | {r.sourceend + 1 for r in self.ranges})
 
 
     def map_forward(self, source):
         relevant_range = next((r for r in self.ranges if r.contains_src(source)), None)
         return source if relevant_range is None else relevant_range.map_forward(source)
 
-    def map_range_forward(self, sourcestart, sourceend):
-        assert sourcestart <= sourceend
-        if sourcestart == sourceend:
-            mapped = self.map_forward(sourcestart)
-            return [(mapped, mapped)]
-
-        if len(self.ranges) == 0 or sourceend < self.ranges[0].source or sourcestart > self.ranges[-1].sourceend:
-            return [(sourcestart, sourceend)]
-        idx = 0
-        while idx < len(self.ranges) and not (self.ranges[idx].intersect(sourcestart, sourceend)):
-            idx += 1
-        out = []
-        lower = sourcestart
-        upper = sourceend
-        while (lower <= upper):
-            if idx >= len(self.ranges):
-                out.append((lower, upper))
-                break
-            r = self.ranges[idx]
-            if r.source > lower:
-                out.append((lower, min(r.source - 1, upper)))
-                lower = r.source
-            if lower >= upper:
-                break
-            out.append(r.maprange(lower, upper))
-            lower = min(upper, r.sourceend + 1)
-            if lower >= upper:
-                break
-            idx += 1
-        return out
+    def map_intervals_forward(self, intervals: IntervalSet) -> IntervalSet:
+        pieces = []
+        for start, end in intervals.split(self.breakpoints):
+            idx = bisect_right(self.sources, start) - 1
+            if idx >= 0 and self.ranges[idx].contains_src(start):
+                offset = self.ranges[idx].dest - self.ranges[idx].source
+                pieces.append((start + offset, end + offset))
+            else:
+                pieces.append((start, end))
+        # overlapping results are merged, so the sets stay small from one map to the next
+        return IntervalSet(pieces)
 
     def __str__(self):
         out = ""
@@ -162,43 +142,58 @@ def findLowestLocation1(seeds, maps):
 
 
 def findLowestLocation2(seeds, maps):
-    # bfs over maps
+    # all seed ranges at once, as a set of intervals pushed through the maps
     mapdict = {map.from_: map for map in maps}
-    locations = []
-    for seed, rangelen in zip(seeds[0::2], seeds[1::2]):
-        srcmap = mapdict['seed']
-        val = [(seed, seed + rangelen - 1)]
-        # print(f"{srcmap.from_} {val}, ", end="")
-        while (srcmap.to != 'location'):
-            val = [srcmap.map_range_forward(sourcestart, sourceend) for (sourcestart, sourceend) in val]
-            val = [r for sublist in val for r in sublist]  # flatten
-            srcmap = mapdict[srcmap.to]
-            # print(f"{srcmap.from_} {val}, ", end="")
-        locationranges = [srcmap.map_range_forward(sourcestart, sourceend) for (sourcestart, sourceend) in val]
-        locationranges = [r for sublist in locationranges for r in sublist]
-        locations.append(min((start for (start, _) in locationranges)))
-
-    return min(locations)
-
-
-def part1(lines):
+    srcmap = mapdict['seed']
+    intervals = IntervalSet((seed, seed + rangelen) for seed, rangelen in zip(seeds[0::2], seeds[1::2]))
+    while True:
+        intervals = srcmap.map_intervals_forward(intervals)
+        logger.debug("%s: %d intervals", srcmap.to, len(intervals))
+        if srcmap.to == 'location':
+            break
+        srcmap = mapdict[srcmap.to]
+    return intervals.min()
+
+
+def parse(lines):
     seeds, maps = parseMaps(lines)
     buildGraph(maps)
-    logger.info(f"Part 1: {findLowestLocation1(seeds, maps)}")
+    return seeds, maps
 
 
-def part2(lines):
-    seeds, maps = parseMaps(lines)
-    buildGraph(maps)
-    logger.info(f"Part 2: {findLowestLocation2(seeds, maps)}")
+def part1(almanac):
+    seeds, maps = almanac
+    return findLowestLocation1(seeds, maps)
+
+
+def part2(almanac):
+    seeds, maps = almanac
+    return findLowestLocation2(seeds, maps)
 
 
 def main():
-    input_file = sys.argv[1] if len(sys.argv) > 1 else 'input.txt'
-    with open(input_file) as f:
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    import sys
+    import os
+    infile = sys.argv[1] if len(sys.argv) > 1 else 'input.txt'
+    if not os.path.isfile(infile):
+        logger.error(f"Input file {infile} does not exist")
+        return
+
+    with open(infile) as f:
         lines = f.readlines()
-    part1(lines)
-    part2(lines)
+    data = parse(lines)
+
+    for i, fun in enumerate((part1, part2), start=1):
+        try:
+            result = fun(data)
+        except NotImplementedError as e:
+            logger.debug(e)
+            continue
+        if result is None:
+            logger.error(f"Part {i} does not return a result")
+            continue
+        logger.info(f"Part {i}: {result}")
 
 
 if __name__ == '__main__':
@@ -1,8 +1,6 @@
 import logging
-import sys
 import re
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
@@ -64,21 +62,37 @@ def part1(lines):
     result = 1
     for r in races:
         result *= r.numWinPossibilitiesImproved()
-    logger.info(f"Part 1: {result}")
+    return result
 
 
 def part2(lines):
     race = parseinput2(lines)
     result = race.numWinPossibilitiesImproved()
-    logger.info(f"Part 2: {result}")
+    return result
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    import sys
+    import os
     infile = sys.argv[1] if len(sys.argv) > 1 else 'input.txt'
+    if not os.path.isfile(infile):
+        logger.error(f"Input file {infile} does not exist")
+        return
+
     with open(infile) as f:
         lines = f.readlines()
-    part1(lines)
-    part2(lines)
+
+    for i, fun in enumerate((part1, part2), start=1):
+        try:
+            result = fun(lines)
+        except NotImplementedError as e:
+            logger.debug(e)
+            continue
+        if result is None:
+            logger.error(f"Part {i} does not return a result")
+            continue
+        logger.info(f"Part {i}: {result}")
 
 
 if __name__ == '__main__':
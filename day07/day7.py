@@ -1,12 +1,10 @@
 import logging
-import sys
 import re
 from enum import Enum
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-
+STREAMING = (1, 2)
 
 
 STRENGTHS = ['A', 'K', 'Q', 'T', '9', '8', '7', '6', '5', '4', '3', '2', 'J']
@@ -126,6 +124,13 @@ class Hand:
     def __repr__(self):
         return self.__str__()
 
+    def key(self):
+        # orders like __cmp__: the type first, then the cards from left to right
+        key = 7 - self.type.value
+        for card in self.cards:
+            key = key * len(STRENGTHS) + STRENGTHS[card.letter]
+        return key
+
     def __cmp__(self, other):
         try:
             if self.type != other.type:
@@ -149,43 +154,68 @@ class Hand:
         return self.__cmp__(other) == 0
 
 
-def parseinput(lines, jokers=False):
-    hands = []
+def parseinput(lines):
+    # (cards, bid) pairs, the hands are created per part since jokers change their type
     for line in lines:
         match = re.match(r'(?P<hand>[AKQJT2-9]+)\s+(?P<bid>\d+)\n?', line)
         cards = match.group('hand')
         bid = int(match.group('bid'))
-        hands.append(Hand(cards, bid, jokers=jokers))
-    return hands
+        yield cards, bid
+
+
+def totalwinnings(cardsandbids, jokers: bool = False):
+    # Single pass without keeping the hands: equal hands are ranked in input order (like the
+    # stable sort did), so per distinct hand the count, the bid sum and sum(index * bid) suffice
+    groups = {}
+    for cards, bid in cardsandbids:
+        group = groups.setdefault(Hand(cards, bid, jokers=jokers).key(), [0, 0, 0])
+        group[2] += group[0] * bid
+        group[0] += 1
+        group[1] += bid
+    logger.info("Got %d distinct hands", len(groups))
+
+    totalvalue = 0
+    ranked = 0
+    for key in sorted(groups):
+        count, bidsum, weighted = groups[key]
+        totalvalue += bidsum * (ranked + 1) + weighted
+        ranked += count
+    return totalvalue
 
 
 def part1(lines):
     global STRENGHTS
     STRENGTHS = ['A', 'K', 'Q', 'J', 'T', '9', '8', '7', '6', '5', '4', '3', '2']
     STRENGTHS = {l: x for (l, x) in zip(STRENGTHS[::-1], range(len(STRENGTHS)))}
-    hands = sorted(parseinput(lines))
-    logger.info(f"Created {len(hands)} hands")
-    # logger.info(f"{hands}")
-
-    totalvalue = sum((hand.bid * rank for (hand, rank) in zip(hands, range(1, len(hands) + 1))))
-    logger.info(f"Part 1: {totalvalue}")
+    return totalwinnings(parseinput(lines))
 
 
 def part2(lines):
-    hands = sorted(parseinput(lines, jokers=True))
-    logger.info(f"Created {len(hands)} hands")
-    # logger.info(f"{hands}")
-
-    totalvalue = sum((hand.bid * rank for (hand, rank) in zip(hands, range(1, len(hands) + 1))))
-    logger.info(f"Part 2: {totalvalue}")
+    return totalwinnings(parseinput(lines), jokers=True)
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    import sys
+    import os
     infile = sys.argv[1] if len(sys.argv) > 1 else 'input.txt'
-    with open(infile) as f:
-        lines = f.readlines()
-    part1(lines)
-    part2(lines)
+    if not os.path.isfile(infile):
+        logger.error(f"Input file {infile} does not exist")
+        return
+
+    for i, fun in enumerate((part1, part2), start=1):
+        with open(infile) as f:
+            # the parts in STREAMING read the file lazily, line by line
+            lines = f if i in STREAMING else f.readlines()
+            try:
+                result = fun(lines)
+            except NotImplementedError as e:
+                logger.debug(e)
+                continue
+        if result is None:
+            logger.error(f"Part {i} does not return a result")
+            continue
+        logger.info(f"Part {i}: {result}")
 
 
 if __name__ == '__main__':
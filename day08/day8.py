@@ -1,8 +1,6 @@
 import logging
-import sys
 import re
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
@@ -62,7 +60,7 @@ def part1(lines):
             else:
                 node = goright(node)
             steps += 1
-    logger.info(f"Part 1: {steps}")
+    return steps
 
 
 def gcdb(a, b):
@@ -97,6 +95,7 @@ def part2(lines):
 
     steps = 0
     moduli = [-1]*len(nodelist)
+    tracing = logger.isEnabledFor(logging.DEBUG)
     while not all((m >= 0 for m in moduli)):
         move = movesequence[steps % len(movesequence)]
         if move == 'L':
@@ -104,7 +103,8 @@ def part2(lines):
         else:
             nodelist = goright(nodelist)
         steps += 1
-        logger.debug(f"{nodelist}")
+        if __debug__ and tracing:
+            logger.debug("%s", nodelist)
         # check which nodes have reached the target
         for i, node in enumerate(nodelist):
             if moduli[i] >= 0:
@@ -114,15 +114,31 @@ def part2(lines):
     assert min(moduli) >= 0
     moduli = [x for x in moduli if x > 0]
     result = lcm(moduli)
-    logger.info(f"Part 2: {result}")
+    return result
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    import sys
+    import os
     infile = sys.argv[1] if len(sys.argv) > 1 else 'input.txt'
+    if not os.path.isfile(infile):
+        logger.error(f"Input file {infile} does not exist")
+        return
+
     with open(infile) as f:
         lines = f.readlines()
-    part1(lines)
-    part2(lines)
+
+    for i, fun in enumerate((part1, part2), start=1):
+        try:
+            result = fun(lines)
+        except NotImplementedError as e:
+            logger.debug(e)
+            continue
+        if result is None:
+            logger.error(f"Part {i} does not return a result")
+            continue
+        logger.info(f"Part {i}: {result}")
 
 
 if __name__ == '__main__':
@@ -1,62 +1,72 @@
 import logging
-import sys
 import re
 import numpy as np
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+STREAMING = (1, 2)
+CHUNKED = (1, 2)
+
 
 def parseinput(lines):
-    numbers = []
     for line in lines:
-        nums = [int(n) for n in line.strip().split()]
-        numbers.append(nums)
-    return np.array(numbers, dtype=np.int64)
+        yield np.array([int(n) for n in line.strip().split()], dtype=np.int64)
 
 
 def solve(lines, backward = False):
-    history = parseinput(lines)
-    logger.info(f"Input shape: {history.shape}")
-    extrapolated = np.empty(history.shape[0], dtype=np.int64)
-    for i, row in enumerate(history):
+    # every history is extrapolated on its own, so only the current line is kept
+    total = 0
+    for row in parseinput(lines):
         stack = [row]
         while not np.all(stack[-1] == 0):
             stack.append(stack[-1][1:] - stack[-1][:-1])
         assert min((len(entry) for entry in stack)) > 0
         if len(stack) == 1:
-            extrapolated[i] = 0
             continue
         if not backward:
             stack[-1] = np.concatenate((stack[-1], np.array([0])))
             for idx in range(len(stack) - 2, -1, -1):
                 stack[idx] = np.concatenate((stack[idx], np.array([stack[idx + 1][-1] + stack[idx][-1]])))
-            extrapolated[i] = stack[0][-1]
+            total += int(stack[0][-1])
         else:
             stack[-1] = np.concatenate((np.array([0]), stack[-1]))
             for idx in range(len(stack) - 2, -1, -1):
                 stack[idx] = np.concatenate((np.array([-stack[idx + 1][0] + stack[idx][0]]), stack[idx]))
-            extrapolated[i] = stack[0][0]
+            total += int(stack[0][0])
 
-    return extrapolated
+    return total
 
 
 def part1(lines):
-    extrapolated = solve(lines)
-    logger.info(f"Part 1: {extrapolated.sum()}")
+    return solve(lines)
 
 
 def part2(lines):
-    extrapolated = solve(lines, backward=True)
-    logger.info(f"Part 2: {extrapolated.sum()}")
+    return solve(lines, backward=True)
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    import sys
+    import os
     infile = sys.argv[1] if len(sys.argv) > 1 else 'input.txt'
-    with open(infile) as f:
-        lines = f.readlines()
-    part1(lines)
-    part2(lines)
+    if not os.path.isfile(infile):
+        logger.error(f"Input file {infile} does not exist")
+        return
+
+    for i, fun in enumerate((part1, part2), start=1):
+        with open(infile) as f:
+            # the parts in STREAMING read the file lazily, line by line
+            lines = f if i in STREAMING else f.readlines()
+            try:
+                result = fun(lines)
+            except NotImplementedError as e:
+                logger.debug(e)
+                continue
+        if result is None:
+            logger.error(f"Part {i} does not return a result")
+            continue
+        logger.info(f"Part {i}: {result}")
 
 
 if __name__ == '__main__':
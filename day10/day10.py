@@ -1,10 +1,21 @@
 import logging
+import os
 import sys
-import re
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+if __name__ == "__main__":
+    # run as a script: the shared aoc package is one directory up
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.search import DX, DY, bfsLayers, visitedBuffer  # noqa: E402
+
 logger = logging.getLogger(__name__)
 
+# tile byte -> directions the pipe connects to, in aoc.search order: up, right, down, left
+PIPEDIRECTIONS = [()] * 256
+for letter, directions in {"|": (0, 2), "-": (1, 3), "L": (0, 1), "J": (0, 3), "7": (2, 3), "F": (1, 2),
+                           "S": (0, 1, 2, 3)}.items():
+    PIPEDIRECTIONS[ord(letter)] = directions
+
 
 class Node:
     def __init__(self, letter, y, x):
@@ -121,25 +132,32 @@ class Node:
 
 class PipeSystem:
     def __init__(self, lines):
-        lines = [line.strip() for line in lines]
-        self.width = len(lines[0])
-        self.height = len(lines)
-        for line in lines:
-            assert (len(line)) == self.width
+        # numpy is only needed for parsing, so it is not imported with the module
+        from aoc.grid import gridFromLines
+        cells = gridFromLines(lines)
+        self.height, self.width = cells.shape
+        # the tiles as one byte per cell at the flat index y * width + x, the searches run on these
+        self.tiles = cells.tobytes()
+        self.startindex = self.tiles.find(b"S")
+        # the Node objects are only built for the nest search of part2
+        self.cells = cells
+        self.grid = None
+        self.nodes = None
+        self.start = None
+
+    def buildNodes(self):
+        if self.grid is not None:
+            return
+        import numpy as np
+        cells = self.cells
         # nodes is an y*x array
         grid = [[None for _ in range(self.width)] for _ in range(self.height)]
         startnode = None
 
-        for y, line in enumerate(lines):
-            for x, char in enumerate(line):
-                match char:
-                    case ".":
-                        continue
-                    case "S":
-                        startnode = Node(char, y, x)
-                        grid[y][x] = startnode
-                    case _:
-                        grid[y][x] = Node(char, y, x)
+        for y, x in np.argwhere(cells != ord(".")).tolist():
+            grid[y][x] = Node(chr(cells[y, x]), y, x)
+            if grid[y][x].letter == "S":
+                startnode = grid[y][x]
         self.grid = grid
         for y, line in enumerate(self.grid):
             for x, node in enumerate(line):
@@ -187,12 +205,13 @@ class PipeSystem:
         return self.grid[y][x] if self.grid[y][x] is not None else Node(".", y, x)
 
     def __str__(self):
-        return f"Pipesystem with {len(self.nodes)} nodes, starting it {self.start}"
+        return f"Pipesystem {self.height}x{self.width}, starting at {divmod(self.startindex, self.width)}"
 
     def __repr__(self):
         return self.__str__()
 
     def getNestSize(self):
+        self.buildNodes()
         bb = self.getLoopBoundingBox()
         bb = (0, 0, self.height - 1, self.width - 1)
         logger.info(f"Calculated BB:")
@@ -230,7 +249,7 @@ class PipeSystem:
             allseen = [firstnode]
             if not firstnode.isjunk():
                 return 0
-            logger.debug(f"Flooding at node {(y, x)}")
+            logger.debug("Flooding at node (%d, %d)", y, x)
             setvisited(y, x)
             while (len(queue) > 0):
                 for node in queue:
@@ -307,7 +326,8 @@ class PipeSystem:
                             case _:
                                 print(getvisited(y, x), end="")
                 print("")
-        drawGrid()
+        if logger.isEnabledFor(logging.DEBUG):
+            drawGrid()
         logger.info(f"Counter clock-wise: {ccw}")
         return nestsize
 
@@ -329,43 +349,64 @@ class PipeSystem:
 
 
     def getFarthestNode(self):
-        if self.start is None:
-            self.start = next((node for node in self.nodes if node.letter == "S"))
-        assert self.start is not None
+        assert self.startindex >= 0, "No start tile"
+        height = self.height
+        width = self.width
+        tiles = self.tiles
+
+        # BFS over the flat indices y * width + x, the depth of the last layer is the farthest distance.
+        # Two tiles are connected if both pipes point at each other.
+        def neighbors(index):
+            y, x = divmod(index, width)
+            for direction in PIPEDIRECTIONS[tiles[index]]:
+                yn, xn = y + DY[direction], x + DX[direction]
+                if 0 <= yn < height and 0 <= xn < width:
+                    neighbor = yn * width + xn
+                    if (direction + 2) % 4 in PIPEDIRECTIONS[tiles[neighbor]]:
+                        yield neighbor
+
+        farthest = 0
+        for depth, _ in bfsLayers([self.startindex], neighbors, visitedBuffer(height * width)):
+            farthest = depth
+        return farthest
 
-        # BFS
-        distmap = {node: -1 for node in self.nodes}
-        currentdist = 0
-        queue = [self.start]
 
-        def visited(node):
-            return distmap[node] > -1
-        while (len(queue) > 0):
-            for node in queue:
-                distmap[node] = currentdist
-            currentdist += 1
-            queue = [neighbor for node in queue for neighbor in node.getNeighbors() if not visited(neighbor)]
-        return currentdist - 1
+def parse(lines):
+    return PipeSystem(lines)
 
 
-def part1(lines):
-    pipes = PipeSystem(lines)
-    logger.info(f"Part 1: {pipes.getFarthestNode()}")
-    return pipes
+def part1(pipes):
+    return pipes.getFarthestNode()
 
 
-def part2(lines):
-    pipes = part1(lines)
+def part2(pipes):
     nestsize = pipes.getNestSize()
-    logger.info(f"Part 2: {nestsize}")
+    return nestsize
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    import sys
+    import os
     infile = sys.argv[1] if len(sys.argv) > 1 else 'input.txt'
+    if not os.path.isfile(infile):
+        logger.error(f"Input file {infile} does not exist")
+        return
+
     with open(infile) as f:
         lines = f.readlines()
-    # part1(lines)
-    part2(lines)
+    data = parse(lines)
+
+    for i, fun in enumerate((part1, part2), start=1):
+        try:
+            result = fun(data)
+        except NotImplementedError as e:
+            logger.debug(e)
+            continue
+        if result is None:
+            logger.error(f"Part {i} does not return a result")
+            continue
+        logger.info(f"Part {i}: {result}")
 
 
 if __name__ == '__main__':
@@ -1,40 +1,34 @@
 import logging
-import sys
 import numpy as np
+import os
+import sys
+
+if __name__ == "__main__":
+    # run as a script: the shared aoc package is one directory up
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.grid import gridFromLines  # noqa: E402
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
 class Universe:
     def __init__(self, lines):
-        self.width = len(lines[0].strip())
-        self.height = len(lines)
-        self.grid = np.zeros((self.height, self.width), dtype=np.int8)
+        cells = gridFromLines(lines)
+        self.height, self.width = cells.shape
+        self.grid = (cells == ord("#")).astype(np.int8)
         self.galaxymap = {}
-        for y, line in enumerate(lines):
-            for x, char in enumerate(line.strip()):
-                match char:
-                    case ".":
-                        # do nothing
-                        pass
-                    case "#":
-                        self.grid[y][x] = 1
-                    case _:
-                        logger.error(f"Unexpected at {(y, x)}: {char}")
+        for y, x in np.argwhere((cells != ord(".")) & (cells != ord("#"))).tolist():
+            logger.error(f"Unexpected at {(y, x)}: {chr(cells[y, x])}")
         self.updateGalaxyMap()
-        logger.info(f"Parsed {y} x {x} grid with {self.getNumGalaxies()} galaxies")
+        logger.info(f"Parsed {self.height} x {self.width} grid with {self.getNumGalaxies()} galaxies")
         self.age = 1
 
     def getNumGalaxies(self):
         return len(self.galaxymap)
 
     def updateGalaxyMap(self):
-        self.galaxymap = {}
-        for y, row in enumerate(self.grid):
-            for x, val in enumerate(row):
-                if val == 1:
-                    self.galaxymap[len(self.galaxymap)] = (y, x)
+        self.galaxymap = {i: (y, x) for i, (y, x) in enumerate(np.argwhere(self.grid == 1).tolist())}
         self.reverseGalaxymap = {val: key for (key, val) in self.galaxymap.items()}
         assert np.sum(self.grid) == len(self.galaxymap) == len(self.reverseGalaxymap)
 
@@ -114,11 +108,13 @@ class Universe:
         pathlengths = []
         numgalaxies = self.getNumGalaxies()
         if not usevirtual:
+            tracing = logger.isEnabledFor(logging.DEBUG)
             for g1, g2 in ((g1, g2) for g1 in range(0, numgalaxies) for g2 in range(g1 + 1, numgalaxies)):
                 g1pos = self.galaxymap[g1]
                 g2pos = self.galaxymap[g2]
                 pathlengths.append(abs(g1pos[0] - g2pos[0]) + abs(g1pos[1] - g2pos[1]))
-                logger.debug(f"{(g1, g2)}: distance {pathlengths[-1]}")
+                if __debug__ and tracing:
+                    logger.debug("(%d, %d): distance %d", g1, g2, pathlengths[-1])
         else:
             for g1, g2 in ((g1, g2) for g1 in range(0, numgalaxies) for g2 in range(g1 + 1, numgalaxies)):
                 pathlengths.append(self.getDistance(g1, g2))
@@ -130,22 +126,38 @@ def part1(lines):
     universe = Universe(lines)
     universe.setVirtualAge(1)
     # print(universe)
-    print(f"Part 1: {universe.shortestPaths(usevirtual=True)}")
+    return universe.shortestPaths(usevirtual=True)
 
 
 def part2(lines):
     universe = Universe(lines)
     universe.setVirtualAge(int(1e6) - 1)
     # print(universe)
-    print(f"Part 2: {universe.shortestPaths(usevirtual=True)}")
+    return universe.shortestPaths(usevirtual=True)
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    import sys
+    import os
     infile = sys.argv[1] if len(sys.argv) > 1 else 'input.txt'
+    if not os.path.isfile(infile):
+        logger.error(f"Input file {infile} does not exist")
+        return
+
     with open(infile) as f:
         lines = f.readlines()
-    part1(lines)
-    part2(lines)
+
+    for i, fun in enumerate((part1, part2), start=1):
+        try:
+            result = fun(lines)
+        except NotImplementedError as e:
+            logger.debug(e)
+            continue
+        if result is None:
+            logger.error(f"Part {i} does not return a result")
+            continue
+        logger.info(f"Part {i}: {result}")
 
 
 if __name__ == '__main__':
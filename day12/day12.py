@@ -1,10 +1,11 @@
 import logging
-import sys
 from enum import Enum
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+STREAMING = (1, 2)
+CHUNKED = (1, 2)
+
 
 class Condition(Enum):
     OPERATIONAL = 0
@@ -139,26 +140,40 @@ def part1(lines):
         spring = Springs(line)
         result += spring.possibilities()
 
-    logger.info(f"Part 1: {result}")
+    return result
 
 
 def part2(lines):
     result = 0
-
-    import ipdb; ipdb.set_trace()
     for line in lines:
         spring = Springs(line, isFold=True)
         result += spring.possibilities()
 
-    logger.info(f"Part 2: {result}")
+    return result
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    import sys
+    import os
     infile = sys.argv[1] if len(sys.argv) > 1 else 'input.txt'
-    with open(infile) as f:
-        lines = f.readlines()
-    part1(lines)
-    part2(lines)
+    if not os.path.isfile(infile):
+        logger.error(f"Input file {infile} does not exist")
+        return
+
+    for i, fun in enumerate((part1, part2), start=1):
+        with open(infile) as f:
+            # the parts in STREAMING read the file lazily, line by line
+            lines = f if i in STREAMING else f.readlines()
+            try:
+                result = fun(lines)
+            except NotImplementedError as e:
+                logger.debug(e)
+                continue
+        if result is None:
+            logger.error(f"Part {i} does not return a result")
+            continue
+        logger.info(f"Part {i}: {result}")
 
 
 if __name__ == '__main__':
@@ -1,16 +1,22 @@
 import logging
-import sys
 import numpy as np
+import os
+import sys
+
+if __name__ == "__main__":
+    # run as a script: the shared aoc package is one directory up
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.grid import gridFromLines  # noqa: E402
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
 def parsegrid(lines):
-    lines = [line.strip() for line in lines if len(line.strip()) > 0]
+    lines = [line for line in lines if len(line.strip()) > 0]
     if not lines:
         return 0
-    return np.array([[x == "#" for x in line] for line in lines], np.int8)
+    return (gridFromLines(lines) == ord("#")).astype(np.int8)
 
 
 def findReflections(grid: np.ndarray, smudge):
@@ -64,6 +70,7 @@ def part2(lines):
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     infile = sys.argv[1] if len(sys.argv) > 1 else 'input.txt'
     with open(infile) as f:
         lines = f.readlines()
@@ -1,8 +1,19 @@
 import logging
+import os
+import sys
+
+if __name__ == "__main__":
+    # run as a script: the shared aoc package is one directory up
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+EMPTY = 0
+ROUND = 1
+CUBE = 2
+TILES = {"O": ROUND, "#": CUBE}
+SYMBOLS = ".O#"
+
 
 def tiltUpDown(grid, direction):
     assert direction in ["north", "south"]
@@ -13,15 +24,12 @@ def tiltUpDown(grid, direction):
             y = height - 1 - y
         for x, tile in enumerate(line):
             # if there is a rounded rock, move it north till it hits an obstacle
-            match tile:
-                case "O":
-                    destination = y
-                    while (destination > 0 if direction > 0 else destination < height - 1) and grid[destination - direction][x] == ".":
-                        destination -= direction
-                    grid[y][x] = "."
-                    grid[destination][x] = "O"  # can equal y
-                case _:
-                    continue
+            if tile == ROUND:
+                destination = y
+                while (destination > 0 if direction > 0 else destination < height - 1) and grid[destination - direction][x] == EMPTY:
+                    destination -= direction
+                grid[y][x] = EMPTY
+                grid[destination][x] = ROUND  # can equal y
 
 
 def tiltLeftRight(grid, direction):
@@ -34,15 +42,12 @@ def tiltLeftRight(grid, direction):
             x = width - 1 - x
         for y in range(height):
             tile = grid[y][x]
-            match tile:
-                case "O":
-                    destination = x
-                    while (destination > 0 if direction > 0 else destination < width - 1) and grid[y][destination - direction] == ".":
-                        destination -= direction
-                    grid[y][x] = "."
-                    grid[y][destination] = "O"
-                case _:
-                    continue
+            if tile == ROUND:
+                destination = x
+                while (destination > 0 if direction > 0 else destination < width - 1) and grid[y][destination - direction] == EMPTY:
+                    destination -= direction
+                grid[y][x] = EMPTY
+                grid[y][destination] = ROUND
 
 
 def tiltnorth(grid):
@@ -63,7 +68,7 @@ def tiltwest(grid):
 
 def printgrid(grid):
     for line in grid:
-        print("".join(line))
+        print("".join(SYMBOLS[tile] for tile in line))
     print("")
 
 
@@ -73,7 +78,7 @@ def calculateLoad(grid):
     if not isinstance(grid, np.ndarray):
         for y, line in enumerate(grid):
             loadfactor = len(grid) - y
-            total += loadfactor * len([tile for tile in line if tile == "O"])
+            total += loadfactor * len([tile for tile in line if tile == ROUND])
     else:
         if len(grid.shape) == 2:
             grid = np.sum(grid, axis=1, dtype=np.uint64)
@@ -92,25 +97,30 @@ def spinCycle(grid, printout=False):
     return grid
 
 
-def part1(lines):
-    grid = [list(line.strip()) for line in lines]
-    assert min((len(line) for line in grid)) == max((len(line) for line in grid))
+def parse(lines):
+    # read-only uint8 grid of EMPTY, ROUND and CUBE, both parts tilt their own copy.
+    # aoc.grid pulls in numpy, so it is imported here instead of at module level
+    from aoc.grid import gridFromLines, translationTable, translate
+    return translate(gridFromLines([line for line in lines if line.strip()]), translationTable(TILES))
+
+
+def part1(cells):
+    grid = cells.tolist()
 
     tiltnorth(grid)
 
     return calculateLoad(grid)
 
 
-def part2(lines):
-    grid = [list(line.strip()) for line in lines]
-    assert min((len(line) for line in grid)) == max((len(line) for line in grid))
+def part2(cells):
+    grid = cells.tolist()
     # import ipdb; ipdb.set_trace()
     import numpy as np
 
     def gridToNp(grid):
         if isinstance(grid, np.ndarray):
             return grid
-        return np.array([[x == "O" for x in line] for line in grid], np.int8)
+        return (np.array(grid) == ROUND).astype(np.int8)
 
     history = [gridToNp(grid)]
     loadhistory = [calculateLoad(history[0])]
@@ -130,7 +140,7 @@ def part2(lines):
         npgrid = gridToNp(grid)
         i = gridInHistory(npgrid)
         if i is not None:
-            logger.debug(f"Cycle detected: {i}")
+            logger.debug("Cycle detected: %d", i)
             cyclelen = cycle - i + 1
             ffwd = (cycles - i) % cyclelen
             historicalgrid = history[i + ffwd]
@@ -142,6 +152,7 @@ def part2(lines):
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     import sys
     import os
     infile = sys.argv[1] if len(sys.argv) > 1 else 'input.txt'
@@ -151,10 +162,11 @@ def main():
 
     with open(infile) as f:
         lines = f.readlines()
+    data = parse(lines)
 
     for i, fun in enumerate((part1, part2), start=1):
         try:
-            result = fun(lines)
+            result = fun(data)
         except NotImplementedError as e:
             logger.debug(e)
             continue
@@ -1,7 +1,6 @@
 import logging
 from collections import OrderedDict
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
@@ -72,6 +71,7 @@ def part2(lines):
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     import sys
     import os
     infile = sys.argv[1] if len(sys.argv) > 1 else 'input.txt'
@@ -1,7 +1,14 @@
 import logging
+import os
+import sys
 from enum import Flag, auto
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+if __name__ == "__main__":
+    # run as a script: the shared aoc package is one directory up
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.search import DX, DY, bfsLayers, visitedBuffer  # noqa: E402
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,19 +24,6 @@ class Beamdirection(Flag):
     def __repr__(self):
         return self.name
 
-    def walk(self, y, x):
-        # walk in direction on coords
-        if self == Beamdirection.UP:
-            return y - 1, x
-        elif self == Beamdirection.DOWN:
-            return y + 1, x
-        elif self == Beamdirection.LEFT:
-            return y, x - 1
-        elif self == Beamdirection.RIGHT:
-            return y, x + 1
-        else:
-            raise ValueError(f"Unexpected direction {self}")
-
     def split(self):
         if self == Beamdirection.UP or self == Beamdirection.DOWN:
             return (Beamdirection.LEFT, Beamdirection.RIGHT)
@@ -48,125 +42,92 @@ class Beamdirection(Flag):
             return Beamdirection.RIGHT
         assert False, f"Something went wrong: {self}, {mirror}"
 
-    def tochar(self):
-        chars = []
-        if Beamdirection.UP in self:
-            chars.append("^")
-        if Beamdirection.DOWN in self:
-            chars.append("v")
-        if Beamdirection.LEFT in self:
-            chars.append("<")
-        if Beamdirection.RIGHT in self:
-            chars.append(">")
-        if len(chars) == 0:
-            return "."
-        elif len(chars) == 1:
-            return chars[0]
-        else:
-            return str(len(chars))
 
+# search directions in aoc.search order: up, right, down, left
+DIRECTIONINDEX = {Beamdirection.UP: 0, Beamdirection.RIGHT: 1, Beamdirection.DOWN: 2, Beamdirection.LEFT: 3}
+DIRECTIONS = sorted(DIRECTIONINDEX, key=DIRECTIONINDEX.get)
+
+
+def outgoing(tile, direction: Beamdirection):
+    # directions a beam leaves a tile in
+    match tile:
+        case '.':
+            return (direction,)
+        case '-':
+            if direction == Beamdirection.LEFT or direction == Beamdirection.RIGHT:
+                return (direction,)
+            return direction.split()
+        case '|':
+            if direction == Beamdirection.UP or direction == Beamdirection.DOWN:
+                return (direction,)
+            return direction.split()
+        case '\\' | '/':
+            return (direction.reflect(tile),)
+        case _:
+            assert False, f"{tile}"
+
+
+TILES = '.-|\\/'
+INVALID = len(TILES)
+
+# tile code -> entering direction index -> leaving direction indices
+BEAMS = [[tuple(DIRECTIONINDEX[d] for d in outgoing(tile, direction)) for direction in DIRECTIONS] for tile in TILES]
+
+
+class Contraption:
+    # the tiles as one byte per cell, the successors of the beam states are derived from them during the search
+    def __init__(self, lines):
+        # numpy only for the parsing, the search runs on the bytes
+        import numpy as np
+        from aoc.grid import gridFromLines, translationTable, translate
+        tilecodes = translationTable({tile: code for code, tile in enumerate(TILES)}, default=INVALID)
+        cells = translate(gridFromLines([line for line in lines if line.strip()]), tilecodes)
+        if np.any(cells == INVALID):
+            y, x = np.argwhere(cells == INVALID)[0].tolist()
+            raise ValueError(f"Unexpected tile at {y}, {x}")
+        self.height, self.width = cells.shape
+        self.tiles = cells.tobytes()
 
-def calcenergy(directions, printout=False):
-    height = len(directions)
-    width = len(directions[0])
-    import numpy as np
-    energized = np.zeros((height, width), dtype=np.int8)
-    for y in range(height):
-        for x in range(width):
-            energized[y, x] = 1 if directions[y][x] is not None else 0
+    def __str__(self):
+        return f"Contraption {self.height}x{self.width}"
 
-    if printout:
-        for y in range(height):
-            for x in range(width):
-                if energized[y, x] == 1:
-                    print('#', end='')
-                else:
-                    print('.', end='')
-            print('')
-    return np.sum(energized)
-
-
-def printdirections(directions, grid):
-    for y in range(len(grid)):
-        for x in range(len(grid[0])):
-            if grid[y][x] != ".":
-                print(grid[y][x], end='')
-            else:
-                print(directions[y][x].tochar() if directions[y][x] is not None else grid[y][x], end='')
-
-
-def simulate(grid, starty, startx, startdir):
-    height = len(grid)
-    width = len(grid[0])
-    directions = [[None for _ in range(width)] for _ in range(height)]
-
-    queue = []
-    # test all possible left/right injections
-
-    def enqueue(q, y, x, indirection: Beamdirection):
-        if 0 > y or y >= height:
-            return
-        if 0 > x or x >= width:
-            return
-
-        currentdir = directions[y][x]
-        if currentdir is None:
-            directions[y][x] = indirection
-        elif indirection in currentdir:
-            # already in queue or treated
-            return
-        directions[y][x] |= indirection
-        q.append((y, x, indirection))
-
-    enqueue(queue, starty, startx, startdir)
-
-    # import ipdb; ipdb.set_trace()
-    while len(queue) > 0:
-        newqueue = []
-        for y, x, direction in queue:
-            match (grid[y][x]):
-                case '.':
-                    # go further in direction
-                    yn, xn = direction.walk(y, x)
-                    enqueue(newqueue, yn, xn, direction)
-                case '-':
-                    if direction == Beamdirection.LEFT or direction == Beamdirection.RIGHT:
-                        yn, xn = direction.walk(y, x)
-                        enqueue(newqueue, yn, xn, direction)
-                    else:
-                        split = direction.split()
-                        for splitdir in split:
-                            yn, xn = splitdir.walk(y, x)
-                            enqueue(newqueue, yn, xn, splitdir)
-                case '|':
-                    if direction == Beamdirection.UP or direction == Beamdirection.DOWN:
-                        yn, xn = direction.walk(y, x)
-                        enqueue(newqueue, yn, xn, direction)
-                    else:
-                        split = direction.split()
-                        for splitdir in split:
-                            yn, xn = splitdir.walk(y, x)
-                            enqueue(newqueue, yn, xn, splitdir)
-                case '\\' | '/':
-                    newdir = direction.reflect(grid[y][x])
-                    yn, xn = newdir.walk(y, x)
-                    enqueue(newqueue, yn, xn, newdir)
-                case _:
-                    assert False, f"{grid[y][x]}"
-        queue = newqueue
-
-    return calcenergy(directions)
-
-
-def part1(lines):
-    grid = [line.strip() for line in lines]
-    return simulate(grid, 0, 0, Beamdirection.RIGHT)
-
-
-def part2(lines):
-    grid = [line.strip() for line in lines]
-    height = len(grid)
-    width = len(grid[0])
+    def __repr__(self):
+        return self.__str__()
+
+
+def simulate(contraption, starty, startx, startdir):
+    # BFS over the beam states (y * width + x) * 4 + direction, the energized tiles are the positions seen
+    height = contraption.height
+    width = contraption.width
+    tiles = contraption.tiles
+
+    def neighbors(state):
+        position, direction = divmod(state, 4)
+        y, x = divmod(position, width)
+        for newdir in BEAMS[tiles[position]][direction]:
+            yn, xn = y + DY[newdir], x + DX[newdir]
+            if 0 <= yn < height and 0 <= xn < width:
+                yield (yn * width + xn) * 4 + newdir
+
+    energized = bytearray(height * width)
+    start = (starty * width + startx) * 4 + DIRECTIONINDEX[startdir]
+    for _, frontier in bfsLayers([start], neighbors, visitedBuffer(height * width * 4)):
+        for state in frontier:
+            energized[state >> 2] = 1
+    return energized.count(1)
+
+
+def parse(lines):
+    return Contraption(lines)
+
+
+def part1(contraption):
+    return simulate(contraption, 0, 0, Beamdirection.RIGHT)
+
+
+def part2(contraption):
+    height = contraption.height
+    width = contraption.width
 
     def combinations():
         for y in range(height):
@@ -178,13 +139,14 @@ def part2(lines):
 
     record = 0
     for starty, startx, startdir in combinations():
-        energy = simulate(grid, starty, startx, startdir)
+        energy = simulate(contraption, starty, startx, startdir)
         if energy > record:
             record = energy
     return record
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     import sys
     import os
     infile = sys.argv[1] if len(sys.argv) > 1 else 'input.txt'
@@ -194,10 +156,11 @@ def main():
 
     with open(infile) as f:
         lines = f.readlines()
+    data = parse(lines)
 
     for i, fun in enumerate((part1, part2), start=1):
         try:
-            result = fun(lines)
+            result = fun(data)
         except NotImplementedError as e:
             logger.debug(e)
             continue
@@ -1,10 +1,10 @@
 import logging
 import re
-import numpy as np
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+STREAMING = (1, 2)
+
 LINEREGEX = re.compile(r"(?P<direction>[UDLR])\s+(?P<distance>\d+)\s+\(\#(?P<rgb>[0-9a-f]{6})\)")
 
 
@@ -78,47 +78,41 @@ class Grid:
         self.commands = commands
 
     def calculateInside(self):
-        # shoelace formula + pick's theorem
+        # shoelace formula + pick's theorem, in a single pass so the commands may be any iterable
         inner = 0  # inner area
-        borderpoints = 0  # note: original (0, 0) position is included in last edge
+        borderpoints = 0
+        # the loop starts and ends at (0, 0), so the closing edge adds nothing to the shoelace sum
         position = Position(0, 0)  # commands are relative, so we need this for bookkeeping
-        for i in range(len(self.commands)):
-            c1 = self.commands[i]
-            c2 = self.commands[(i + 1) % len(self.commands)]
-            p1 = position + c1
-            p2 = p1 + c2
-            inner += p1.x * p2.y - p1.y * p2.x
-            borderpoints += (p1 - p2).abs()  # length of edge from p1 to p2 (excluding starting point)
-            position = p1
+        for command in self.commands:
+            nextposition = position + command
+            inner += position.x * nextposition.y - position.y * nextposition.x
+            borderpoints += command.distance  # length of the edge (excluding starting point)
+            position = nextposition
         inner = (abs(inner) + borderpoints) // 2 + 1  # + 1 instead of -1 due to the nature of our grid
         return inner
 
 
-def part1(lines):
-    commands = []
+def parseinput(lines, part2=False):
+    # (direction, distance, rgb) per line, the parts interpret them differently
     for line in lines:
-        # parse input
         match = LINEREGEX.match(line.strip())
-        direction, distance, rgb = match['direction'], int(match['distance']), match['rgb']
-        commands.append(Command(direction, distance, rgb))
+        yield Command(match['direction'], int(match['distance']), match['rgb'], part2=part2)
 
-    grid = Grid(commands)
+
+def part1(lines):
+    grid = Grid(parseinput(lines))
     return grid.calculateInside()
 
 
 def part2(lines):
-    commands = []
-    for line in lines:
-        # parse input
-        match = LINEREGEX.match(line.strip())
-        direction, distance, rgb = match['direction'], int(match['distance']), match['rgb']
-        commands.append(Command(direction, distance, rgb, part2=True))
+    commands = parseinput(lines, part2=True)
 
     grid = Grid(commands)
     return grid.calculateInside()
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     import sys
     import os
     infile = sys.argv[1] if len(sys.argv) > 1 else 'input.txt'
@@ -126,15 +120,15 @@ def main():
         logger.error(f"Input file {infile} does not exist")
         return
 
-    with open(infile) as f:
-        lines = f.readlines()
-
     for i, fun in enumerate((part1, part2), start=1):
-        try:
-            result = fun(lines)
-        except NotImplementedError as e:
-            logger.debug(e)
-            continue
+        with open(infile) as f:
+            # the parts in STREAMING read the file lazily, line by line
+            lines = f if i in STREAMING else f.readlines()
+            try:
+                result = fun(lines)
+            except NotImplementedError as e:
+                logger.debug(e)
+                continue
         if result is None:
             logger.error(f"Part {i} does not return a result")
             continue
@@ -1,12 +1,20 @@
 import logging
+import os
 import re
+import sys
+
+if __name__ == "__main__":
+    # run as a script: the shared aoc package is one directory up
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.intervals import IntervalSet  # noqa: E402
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 PARTREGEX = re.compile(r"(?P<attr>[xmas])=(?P<value>\d+)")
 WORKFLOWREGEX = re.compile(r"(?P<name>\w+)\{(?P<instructions>[^\}]*)\}")
 INSTRUCTIONREGEX = re.compile(r"((?P<condition>[^:]+):)?(?P<action>([a-z]+|[AR]))")
+RATINGS = IntervalSet.closed(1, 4000)
 
 
 class Part:
@@ -129,8 +137,12 @@ def parseInput(lines):
     return (workflows, parts)
 
 
-def part1(lines):
-    workflows, parts = parseInput(lines)
+def parse(lines):
+    return parseInput(lines)
+
+
+def part1(system):
+    workflows, parts = system
     assert 'in' in workflows
     result = 0
     for part in parts:
@@ -176,7 +188,7 @@ class Constraint:
 class Constraints:
     def __init__(self):
         self.constraints = []
-        self.intervals = {attr: (1, 4000) for attr in "xmas"}
+        self.intervals = {attr: RATINGS for attr in "xmas"}
 
     def addConstraint(self, instruction: Instruction, invert=False):
         newc = Constraint.from_instr(instruction, invert)
@@ -191,17 +203,16 @@ class Constraints:
         return newc
 
     def _updateInterval(self, constraint: Constraint):
-        lower, upper = self.intervals[constraint.attr]
         if constraint.op == "<":
-            upper = min(upper, constraint.value - 1)
+            allowed = IntervalSet.closed(RATINGS.min(), constraint.value - 1)
         elif constraint.op == ">":
-            lower = max(lower, constraint.value + 1)
-        self.intervals[constraint.attr] = (lower, upper)
+            allowed = IntervalSet.closed(constraint.value + 1, RATINGS.max())
+        self.intervals[constraint.attr] = self.intervals[constraint.attr] & allowed
 
     def solve(self) -> int:
         possibilities = 1
         for interval in self.intervals.values():
-            possibilities *= max(0, interval[1] - interval[0] + 1)
+            possibilities *= interval.size()
         return possibilities
 
     def solvable(self) -> bool:
@@ -214,8 +225,8 @@ class Constraints:
         return self.__str__()
 
 
-def part2(lines):
-    workflows, _ = parseInput(lines)
+def part2(system):
+    workflows, _ = system
 
     # BFS
     class QueueEntry:
@@ -258,6 +269,7 @@ def part2(lines):
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     import sys
     import os
     infile = sys.argv[1] if len(sys.argv) > 1 else 'input.txt'
@@ -267,10 +279,11 @@ def main():
 
     with open(infile) as f:
         lines = f.readlines()
+    data = parse(lines)
 
     for i, fun in enumerate((part1, part2), start=1):
         try:
-            result = fun(lines)
+            result = fun(data)
         except NotImplementedError as e:
             logger.debug(e)
             continue
@@ -3,7 +3,6 @@ from enum import Enum, auto
 import math
 
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
@@ -101,7 +100,8 @@ class Conjunction(Module):
         self.memory[module] = Signal.LOW
 
     def sendsignal(self, signal: Signal, source: Module):
-        logger.debug(f"{source.name} -{signal}-> {self.name}")
+        if __debug__ and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s -%s-> %s", source.name, signal, self.name)
         self.queuedsignal.append(signal)
         self.queuedsignalsource.append(source)
 
@@ -219,6 +219,7 @@ def part2(lines):
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     import sys
     import os
     infile = sys.argv[1] if len(sys.argv) > 1 else 'input.txt'
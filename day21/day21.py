@@ -1,8 +1,15 @@
 import logging
 import numpy as np
-from collections import defaultdict
+import os
+import sys
+
+if __name__ == "__main__":
+    # run as a script: the shared aoc package is one directory up
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.grid import gridFromLines, findChar  # noqa: E402
+from aoc.search import bfsLayers, visitedBuffer  # noqa: E402
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
@@ -10,71 +17,53 @@ def reachable(grid, startingposition, steps, repeat_wrap=0):
     # how many fields of grid are reachable within steps steps
     height = grid.shape[0]
     width = grid.shape[1]
+    # BFS on the grid repeated repeat_wrap times in every direction, states are flat indices into that
+    wrappedheight = height * (1 + repeat_wrap * 2)
+    wrappedwidth = width * (1 + repeat_wrap * 2)
+    rocks = grid.tobytes()
 
-    queue = [startingposition]
-    visited = np.zeros((grid.shape[0] * (1 + repeat_wrap * 2), grid.shape[1] * (1 + repeat_wrap * 2)))
-    reachable = defaultdict(set)
-    reachable[0].add(startingposition)
-
-    def visitedIndex(y, x):
-        return (y + repeat_wrap * height, x + repeat_wrap * width)
-
-    vy, vx = visitedIndex(*startingposition)
-    visited[vy, vx] = 1
-
-    def getneighbors(y, x):
-        neighbors = []
+    def neighbors(index):
+        y, x = divmod(index, wrappedwidth)
         for ny, nx in [(y + 1, x), (y - 1, x), (y, x + 1), (y, x - 1)]:
-            if ny < 0 - repeat_wrap * height or ny >= grid.shape[0] + repeat_wrap * height \
-                    or nx < 0 - repeat_wrap * width or nx >= grid.shape[1] + repeat_wrap * width:
-                logger.error(f"Walked off the grid {(ny, nx)}")
+            if ny < 0 or ny >= wrappedheight or nx < 0 or nx >= wrappedwidth:
+                logger.error(f"Walked off the grid {(ny - repeat_wrap * height, nx - repeat_wrap * width)}")
                 exit(1)
-                continue
-            if grid[(ny + grid.shape[0]) % grid.shape[0], (nx + grid.shape[1]) % grid.shape[1]] == 0:
-                neighbors.append((ny, nx))
-        return neighbors
-
-    for step in range(1, steps + 1):
-        newq = []
-        for y, x in queue:
-            for ny, nx in getneighbors(y, x):
-                reachable[step].add((ny, nx))
-                vy, vx = visitedIndex(ny, nx)
-                if visited[vy, vx] == 0:
-                    visited[vy, vx] = 1
-                    newq.append((ny, nx))
-        queue = newq
-    resultset = set()
+            if rocks[(ny % height) * width + nx % width] == 0:
+                yield ny * wrappedwidth + nx
+
+    starty, startx = startingposition
+    start = (starty + repeat_wrap * height) * wrappedwidth + startx + repeat_wrap * width
+    visited = visitedBuffer(wrappedheight * wrappedwidth)
+    # a field reached after i steps can be reached again after i + 2, 4, ... steps by walking back and forth
     searchmod = steps % 2
-    for i in range(1, min(steps + 1, len(visited) + 1)):
-        if i % 2 == searchmod:
-            resultset.update(reachable[i])
-    return len(resultset)
-
-
-def part1(lines):
-    startingpos = None
-    grid = np.zeros((len(lines), len(lines[0].strip())), dtype=np.int8)
-    for y, line in enumerate(lines):
-        for x, tile in enumerate(line.strip()):
-            grid[y, x] = 1 if tile == "#" else 0
-            if tile == "S":
-                startingpos = (y, x)
-    assert startingpos is not None
+    limit = min(steps, wrappedheight)
+    result = 0
+    for depth, frontier in bfsLayers([start], neighbors, visited, maxdepth=steps):
+        if 0 < depth <= limit and depth % 2 == searchmod:
+            result += len(frontier)
+        elif depth == 1 and searchmod == 0 and limit >= 2:
+            # the start itself only counts once we can step away and back
+            result += 1
+    return result
+
+
+def parse(lines):
+    # rocks as 1, everything else 0, and the starting position
+    cells = gridFromLines(lines)
+    grid = (cells == ord("#")).astype(np.int8)
+    startingpos, = findChar(cells, "S")
+    return grid, startingpos
+
+
+def part1(garden):
+    grid, startingpos = garden
     return reachable(grid, startingpos, 64)
 
 
-def part2(lines):
-    startingpos = None
-    grid = np.zeros((len(lines), len(lines[0].strip())), dtype=np.int8)
+def part2(garden):
+    grid, startingpos = garden
     height, width = grid.shape
     assert height == width
-    for y, line in enumerate(lines):
-        for x, tile in enumerate(line.strip()):
-            grid[y, x] = 1 if tile == "#" else 0
-            if tile == "S":
-                startingpos = (y, x)
-    assert startingpos is not None
     STEPS = 26501365
     n = STEPS // height
     remainder = STEPS % height
@@ -90,6 +79,7 @@ def part2(lines):
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     import sys
     import os
     infile = sys.argv[1] if len(sys.argv) > 1 else 'input.txt'
@@ -99,10 +89,11 @@ def main():
 
     with open(infile) as f:
         lines = f.readlines()
+    data = parse(lines)
 
     for i, fun in enumerate((part1, part2), start=1):
         try:
-            result = fun(lines)
+            result = fun(data)
         except NotImplementedError as e:
             logger.debug(e)
             continue
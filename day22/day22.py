@@ -1,9 +1,16 @@
 import logging
 from enum import Enum
+import os
 import re
+import sys
 from collections import defaultdict
 
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+if __name__ == "__main__":
+    # run as a script: the shared aoc package is one directory up
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.intervals import overlaps  # noqa: E402
+
 logger = logging.getLogger(__name__)
 
 
@@ -104,11 +111,8 @@ class Brick:
 
     @staticmethod
     def _rangeintersect(r1, r2):
-        if r1 > r2:
-            r1, r2 = r2, r1
-        if r1[1] < r2[0] or r1[0] > r2[1]:
-            return False
-        return True
+        # the ranges include both ends
+        return overlaps((r1[0], r1[1] + 1), (r2[0], r2[1] + 1))
 
     def intersect(self, other):
         # test if two bricks intersect on xy axis
@@ -204,15 +208,12 @@ def collapse(bricks, settled, supports, supportedby, desintegratedbrick) -> int:
     return result
 
 
-part2result = None
-
-
-def part1(lines):
-    global part2result
+def parse(lines):
+    # both parts only need the number of falling bricks per desintegrated brick,
+    # so the settling and all the collapses are done once
     bricks, settled, osupports, osupportedby = parsebricks_and_settle(lines)
 
-    result = 0
-    part2result = 0
+    fallingcounts = []
     for brick in bricks:
         # we copy the support lists as we need to manipulate inside the collapse function
         supports = defaultdict(list)
@@ -221,41 +222,21 @@ def part1(lines):
         supportedby = defaultdict(list)
         for key, value in osupportedby.items():
             supportedby[key] = value.copy()
-        falling = collapse(bricks, settled, supports, supportedby, brick)
-
-        # falling is the number of bricks which have fallen as a result
-        # of removing the brick
-        if falling == 0:
-            # this means we can safely desintegrate this brick
-            result += 1
-        else:
-            # the number of falling bricks is relevant to part2
-            part2result += falling
-    return result
+        fallingcounts.append(collapse(bricks, settled, supports, supportedby, brick))
+    return fallingcounts
 
 
-def part2(lines):
-    global part2result
-    if part2result is not None:
-        # calculated by part1 already
-        return part2result
+def part1(fallingcounts):
+    # a brick can be desintegrated safely if nothing falls as a result
+    return sum(1 for falling in fallingcounts if falling == 0)
 
-    bricks, settled, osupports, osupportedby = parsebricks_and_settle(lines)
 
-    result = 0
-    for brick in bricks:
-        # we copy the support lists as we need to manipulate them now
-        supports = defaultdict(list)
-        for key, value in osupports.items():
-            supports[key] = value.copy()
-        supportedby = defaultdict(list)
-        for key, value in osupportedby.items():
-            supportedby[key] = value.copy()
-        result += collapse(bricks, settled, supports, supportedby, brick)
-    return result
+def part2(fallingcounts):
+    return sum(fallingcounts)
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     import sys
     import os
     infile = sys.argv[1] if len(sys.argv) > 1 else 'input.txt'
@@ -265,10 +246,11 @@ def main():
 
     with open(infile) as f:
         lines = f.readlines()
+    data = parse(lines)
 
     for i, fun in enumerate((part1, part2), start=1):
         try:
-            result = fun(lines)
+            result = fun(data)
         except NotImplementedError as e:
             logger.debug(e)
             continue
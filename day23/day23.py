@@ -1,17 +1,26 @@
 import logging
-from enum import Enum
+from enum import IntEnum
 import numpy as np
+import os
+import sys
+
+if __name__ == "__main__":
+    # run as a script: the shared aoc package is one directory up
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.grid import gridFromLines, translationTable, translate  # noqa: E402
+from aoc.search import DX, DY, encode, longestPath  # noqa: E402
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
-class TileType(Enum):
-    PATH = 1,
-    FOREST = 2,
-    UPSLOPE = 3,
-    DOWNSLOPE = 4,
-    LEFTSLOPE = 5,
+class TileType(IntEnum):
+    # int valued, so the grid can be a plain uint8 array which compares equal to the members
+    PATH = 1
+    FOREST = 2
+    UPSLOPE = 3
+    DOWNSLOPE = 4
+    LEFTSLOPE = 5
     RIGHTSLOPE = 6
 
     @classmethod
@@ -54,6 +63,11 @@ class TileType(Enum):
             raise ValueError(f"Unknown TileType {self}")
 
 
+TILETABLE = translationTable({str(tiletype): tiletype.value for tiletype in TileType})
+# the only direction a slope can be left in, in aoc.search order (up, right, down, left)
+SLOPEDIRECTION = {TileType.UPSLOPE: 0, TileType.RIGHTSLOPE: 1, TileType.DOWNSLOPE: 2, TileType.LEFTSLOPE: 3}
+
+
 class Node:
     def __init__(self, y, x):
         self.neighbors = {}
@@ -115,13 +129,14 @@ class Node:
 
 class HikingMap:
     def __init__(self, lines):
-        self.height = len(lines)
-        self.width = len(lines[0].strip())
-        self.grid = np.zeros((self.height, self.width), dtype=object)
-        for y, line in enumerate(lines):
-            for x, letter in enumerate(line.strip()):
-                self.grid[y, x] = TileType.from_letter(letter)
+        cells = gridFromLines(lines)
+        self.height, self.width = cells.shape
+        self.grid = translate(cells, TILETABLE)
+        if not np.all(self.grid):
+            y, x = np.argwhere(self.grid == 0)[0]
+            raise ValueError(f"Unknown letter {chr(cells[y, x])}")
         self.distances = None
+        self.nodes = None  # compressed graph, built on first use
         self.start = next(((0, x) for x in range(self.width) if self.grid[0, x] == TileType.PATH))
         self.dest = next(((self.height - 1, x) for x in range(self.width) if self.grid[self.height - 1, x] == TileType.PATH))
 
@@ -151,66 +166,32 @@ class HikingMap:
         return
 
     def part1(self):
-        # we always store distance + 1 so we can abuse this as visited map also
-        visited = np.zeros(self.grid.shape, dtype=np.int8)
-        start_time = np.zeros(self.grid.shape, dtype=np.uint32)
-        end_time = np.zeros(self.grid.shape, dtype=np.uint32)
-
-        def neighbors(y, x):
-            ttype = self.grid[y, x]
-            if ttype == TileType.DOWNSLOPE and y < self.height - 1:
-                yield ((y + 1, x))
-            if ttype == TileType.UPSLOPE and y > 0:
-                yield ((y - 1, x))
-            if ttype == TileType.LEFTSLOPE and x > 0:
-                yield ((y, x - 1))
-            if ttype == TileType.RIGHTSLOPE and x < self.width - 1:
-                yield ((y, x + 1))
-            if ttype != TileType.PATH:
-                return
-
-            if y > 0:
-                yield ((y - 1, x))
-            if y < self.height - 1:
-                yield ((y + 1, x))
-            if x > 0:
-                yield ((y, x - 1))
-            if x < self.width - 1:
-                yield ((y, x + 1))
-
-        # DFS
-        stack = [(*self.start, 0)]
-        time = 0
-        maxpathlen = 0
-
-        while stack:
-            time += 1
-            y, x, d = stack.pop()
-            if not visited[y, x]:
-                visited[y, x] = 1
-                stack.append((y, x, d))  # for backtracking
-                start_time[y, x] = time
-                # add all edges
-                if (y, x) == self.dest:
-                    maxpathlen = max(maxpathlen, d)
-                    continue
-                for ny, nx in neighbors(y, x):
-                    ntype = self.grid[ny, nx]
-                    if ntype == TileType.FOREST:
-                        continue
-                    if not visited[ny, nx]:
-                        stack.append((ny, nx, d + 1))
-
-            elif end_time[y, x] == 0:
-                # backtrack
-                end_time[y, x] = time
-                visited[y, x] = 0
-        return maxpathlen
+        # longest simple path over the flat indices y * width + x, slopes can only be left downhill
+        tiles = self.grid.ravel().tolist()
+        width = self.width
+
+        def neighbors(index):
+            y, x = divmod(index, width)
+            ttype = tiles[index]
+            if ttype == TileType.PATH:
+                directions = range(4)
+            else:
+                directions = (SLOPEDIRECTION[ttype],)
+            for direction in directions:
+                ny, nx = y + DY[direction], x + DX[direction]
+                if 0 <= ny < self.height and 0 <= nx < width and tiles[ny * width + nx] != TileType.FOREST:
+                    yield ny * width + nx, 1
+
+        start = encode(*self.start, width)
+        dest = encode(*self.dest, width)
+        longest = longestPath(start, dest, neighbors, self.height * width)
+        return longest if longest is not None else 0
 
     def calculateLongestDistances(self, part2=False):
         if not part2:
             return self.part1()
-        self._buildCompressedGraph()
+        if self.nodes is None:
+            self._buildCompressedGraph()
 
         from collections import defaultdict
         # we always store distance + 1 so we can abuse this as visited map also
@@ -229,7 +210,7 @@ class HikingMap:
                 # add all edges
                 if (node.y, node.x) == self.dest:
                     if d > maxpathlen:
-                        logger.debug(f"New max: {d}")
+                        logger.debug("New max: %d", d)
                         maxpathlen = d
                         # write out max distances
                     continue
@@ -243,20 +224,23 @@ class HikingMap:
         return maxpathlen
 
     def __str__(self):
-        return '\n'.join(''.join(str(x) for x in row) for row in self.grid)
+        return '\n'.join(''.join(str(TileType(x)) for x in row) for row in self.grid)
+
+
+def parse(lines):
+    return HikingMap(lines)
 
 
-def part1(lines):
-    hikingmap = HikingMap(lines)
+def part1(hikingmap):
     return hikingmap.calculateLongestDistances()
 
 
-def part2(lines):
-    hikingmap = HikingMap(lines)
+def part2(hikingmap):
     return hikingmap.calculateLongestDistances(part2=True)
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     import sys
     import os
     infile = sys.argv[1] if len(sys.argv) > 1 else 'input.txt'
@@ -266,10 +250,11 @@ def main():
 
     with open(infile) as f:
         lines = f.readlines()
+    data = parse(lines)
 
     for i, fun in enumerate((part1, part2), start=1):
         try:
-            result = fun(lines)
+            result = fun(data)
         except NotImplementedError as e:
             logger.debug(e)
             continue
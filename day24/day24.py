@@ -1,8 +1,10 @@
 import logging
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# part1 compares all pairs of stones, part2 only needs the first three
+STREAMING = (2,)
+
 
 hailstone_identifier = 0
 
@@ -101,11 +103,12 @@ def part1(lines):
 
 def part2(lines):
     import z3  # pip install z3-solver
-    stones = [HailStone.from_line(line) for line in lines]
+    from itertools import islice
+    stones = [HailStone.from_line(line) for line in islice(lines, 3)]
     x, y, z, vx, vy, vz = z3.Reals("x y z vx vy vz")
     solver = z3.Solver()
     # only 3 hailstones are needed here;  each creates 1 variable and 3 equations, for a total of 9 vars and 9 eqs
-    for i, stone in enumerate(stones[:3]):
+    for i, stone in enumerate(stones):
         ti = z3.Real(f"t{i}")
         solver.add(ti > 0)
         solver.add(x + ti * vx == stone.x + ti * stone.vx)
@@ -118,6 +121,7 @@ def part2(lines):
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     import sys
     import os
     infile = sys.argv[1] if len(sys.argv) > 1 else 'input.txt'
@@ -125,15 +129,15 @@ def main():
         logger.error(f"Input file {infile} does not exist")
         return
 
-    with open(infile) as f:
-        lines = f.readlines()
-
     for i, fun in enumerate((part1, part2), start=1):
-        try:
-            result = fun(lines)
-        except NotImplementedError as e:
-            logger.debug(e)
-            continue
+        with open(infile) as f:
+            # the parts in STREAMING read the file lazily, line by line
+            lines = f if i in STREAMING else f.readlines()
+            try:
+                result = fun(lines)
+            except NotImplementedError as e:
+                logger.debug(e)
+                continue
         if result is None:
             logger.error(f"Part {i} does not return a result")
             continue
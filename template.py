@@ -1,8 +1,17 @@
 import logging
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# parts which only pass over their lines once, the runner feeds them a lazy iterator with --stream
+STREAMING = ()
+# parts whose answer is the sum of the answers over any split of the lines, see aoc.mapreduce
+CHUNKED = ()
+
+
+def parse(lines):
+    # optional, whatever this returns is passed to both parts, so shared preprocessing runs once
+    return lines
+
 
 def part1(lines):
     raise NotImplementedError("Part 1 not yet implemented")
@@ -13,6 +22,7 @@ def part2(lines):
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     import sys
     import os
     infile = sys.argv[1] if len(sys.argv) > 1 else 'input.txt'
@@ -22,10 +32,11 @@ def main():
 
     with open(infile) as f:
         lines = f.readlines()
+    data = parse(lines)
 
     for i, fun in enumerate((part1, part2), start=1):
         try:
-            result = fun(lines)
+            result = fun(data)
         except NotImplementedError as e:
             logger.debug(e)
             continue